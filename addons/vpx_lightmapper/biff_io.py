@@ -15,9 +15,17 @@
 
 import io
 import struct
+import sys
 
+# Precompiled formats of the fixed size values found in BIFF records
+U8 = struct.Struct("<B")
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+I32 = struct.Struct("<i")
+FLOAT = struct.Struct("<f")
 
 class BIFF_reader:
+    # The stream may be a memoryview, in which case data is read in place without intermediate copies
     def __init__(self, stream):
         self.data = stream
         self.pos = 0
@@ -40,42 +48,49 @@ class BIFF_reader:
         return self.data[self.pos - 4] != 0
 
     def get_u8(self):
-        i = struct.unpack("<B", self.data[self.pos:self.pos+1])[0]
+        i = U8.unpack_from(self.data, self.pos)[0]
         self.pos = self.pos + 1
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 1
         return i
 
     def get_u16(self):
-        i = struct.unpack("<H", self.data[self.pos:self.pos+2])[0]
+        i = U16.unpack_from(self.data, self.pos)[0]
         self.pos = self.pos + 2
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 2
         return i
 
     def get_u32(self):
-        i = struct.unpack("<I", self.data[self.pos:self.pos+4])[0]
+        i = U32.unpack_from(self.data, self.pos)[0]
         self.pos = self.pos + 4
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 4
         return i
 
     def get_32(self):
-        i = struct.unpack("<i", self.data[self.pos:self.pos+4])[0]
+        i = I32.unpack_from(self.data, self.pos)[0]
         self.pos = self.pos + 4
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 4
         return i
 
     def get_float(self):
-        i = struct.unpack("<f", self.data[self.pos:self.pos+4])[0]
+        i = FLOAT.unpack_from(self.data, self.pos)[0]
         self.pos = self.pos + 4
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 4
         return i
 
+    # Read all the values of a precompiled struct.Struct at once
+    def unpack(self, fmt):
+        i = fmt.unpack_from(self.data, self.pos)
+        self.pos = self.pos + fmt.size
+        self.bytes_in_record_remaining = self.bytes_in_record_remaining - fmt.size
+        return i
+
     def get_str(self, count):
         pos_0 = count
         for p in range(count):
             if self.data[self.pos+p] == 0:
                 pos_0 = p
                 break
-        i = str(struct.unpack("%ds" % pos_0, self.data[self.pos:self.pos+pos_0])[0], 'latin_1')
+        i = str(self.data[self.pos:self.pos+pos_0], 'latin_1')
         self.pos = self.pos + count
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - count
         return i
@@ -121,7 +136,8 @@ class BIFF_reader:
             self.skip(self.bytes_in_record_remaining)
         self.record_start = self.pos
         self.bytes_in_record_remaining = self.get_u32()
-        self.tag = self.get_str(4)
+        # Tags are interned to share the string instances of the tag literals used for dispatch
+        self.tag = sys.intern(self.get_str(4))
     
     def delete_tag(self):
         self.data = self.data[:self.record_start] + self.data[self.pos + self.bytes_in_record_remaining:]
@@ -146,12 +162,12 @@ class BIFF_reader:
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 4
 
     def put_u32(self, value):
-        self.data[self.pos:self.pos+4] = struct.pack("<I", value)
+        self.data[self.pos:self.pos+4] = U32.pack(value)
         self.pos = self.pos + 4
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 4
 
     def put_float(self, value):
-        self.data[self.pos:self.pos+4] = struct.pack("<f", value)
+        self.data[self.pos:self.pos+4] = FLOAT.pack(value)
         self.pos = self.pos + 4
         self.bytes_in_record_remaining = self.bytes_in_record_remaining - 4
 
@@ -173,7 +189,7 @@ class BIFF_writer:
         if self.tag != b'':
             length = self.data.tell()
             self.data.seek(self.tag_start)
-            self.data.write(struct.pack("<I", self.record_size))
+            self.data.write(U32.pack(self.record_size))
             self.data.seek(length)
         self.tag = b''
         
@@ -187,15 +203,15 @@ class BIFF_writer:
 
     def write_u32(self, value):
         self.record_size = self.record_size + 4
-        self.data.write(struct.pack("<I", value))
+        self.data.write(U32.pack(value))
 
     def write_32(self, value):
         self.record_size = self.record_size + 4
-        self.data.write(struct.pack("<i", value))
+        self.data.write(I32.pack(value))
 
     def write_float(self, value):
         self.record_size = self.record_size + 4
-        self.data.write(struct.pack("<f", value))
+        self.data.write(FLOAT.pack(value))
         
     def write_string(self, value):
         d = value.encode('latin_1')
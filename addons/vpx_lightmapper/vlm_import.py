@@ -23,16 +23,14 @@ import importlib
 import math
 import mathutils
 import zlib
+import hashlib
+import numpy as np
 from math import radians
 from bpy_extras.io_utils import axis_conversion
 from . import biff_io
 from . import vlm_utils
 from . import vlm_collections
 
-# Dependencies which need a custom install (not included in the Blender install)
-from PIL import Image
-import olefile
-
 logger = vlm_utils.logger
 
 
@@ -44,6 +42,36 @@ MOVABLE_COL = 'VPX.Import.Movable' # Objects that may move (bumper ring, switche
 LIGHTS_COL = 'VPX.Import.Lights'
 TMP_COL = 'VPX.Import.Temp' # Used for baking translucency
 
+# Script identifiers which are moved/rotated by the table script (only the object name is captured)
+MOVABLE_RE = re.compile(r'([a-zA-Z][[a-zA-Z0-9_]+)\.(?:rotx-zz|rotandtra0-9|transx-z|objrotx-z|size_x-z)')
+
+# Material record of the game data 'MATE' tag
+MATERIAL_DTYPE = np.dtype({
+    'names': ['name', 'base_color', 'glossy_color', 'clearcoat_color', 'wrap_lighting', 'is_metal', 'roughness', 'glossy_image_lerp', 'edge', 'thickness', 'opacity', 'opacity_active_edge_alpha'],
+    'formats': ['S32', ('u1', 4), ('u1', 4), ('u1', 4), '<f4', 'u1', '<f4', 'u1', '<f4', 'u1', '<f4', 'u1'],
+    'offsets': [0, 32, 36, 40, 44, 48, 52, 56, 60, 64, 68, 72],
+    'itemsize': 76})
+
+# Lookup table to convert a color component from byte to [0..1] range
+BYTE_TO_UNIT = np.arange(256) / 255.0
+
+# Custom split normal of flat meshes facing up (lights, flashers, playfield)
+UP_NORMAL = (0.0, 0.0, 1.0)
+
+# Hit target types which move when hit (drop targets: DropTargetBeveled, DropTargetSimple, DropTargetFlatSimple)
+MOVABLE_HIT_TARGET_TYPES = frozenset((1, 2, 7))
+# Core meshes of hit target types: DropTargetBeveled, DropTargetSimple, HitTargetRound, HitTargetRectangle, HitFatTargetRectangle, HitFatTargetSquare, DropTargetFlatSimple, HitFatTargetSlim, HitTargetSlim
+HIT_TARGET_MESHES = ("", "VPX.Core.Droptargett2", "VPX.Core.Droptargett3",
+    "VPX.Core.Hittargetround", "VPX.Core.Hittargetrectangle", "VPX.Core.Hittargetfatrectangle",
+    "VPX.Core.Hittargetfatsquare", "VPX.Core.Droptargett4", "VPX.Core.Hittargett2slim", "VPX.Core.Hittargett1slim")
+
+# Conversion from VPX primitive mesh space (left handed, y down) to Blender space
+VPX_AXIS_MATRIX = (mathutils.Matrix.Scale(-1, 4, (1,0,0)) @ axis_conversion('-Y', 'Z', 'Y', 'Z').to_4x4()).freeze()
+
+# Precompiled formats of the vectors found in game item tags
+VEC2 = struct.Struct('<2f')
+PADDED_VEC3 = struct.Struct('<3f4x')
+
 
 class VPX_Material(object):
     def __init__(self):
@@ -83,6 +111,29 @@ class VPX_Material(object):
             group.inputs[13].default_value = 0
 
 
+def is_opaque_image_format(data):
+    '''
+    Identify, from its header, image data which can not hold any transparency:
+    JPEG, BMP up to 24 bits per pixel, PNG without alpha channel nor transparency chunk
+    '''
+    if data[:2] == b'\xff\xd8':
+        return True
+    if data[:2] == b'BM' and len(data) >= 30:
+        return struct.unpack_from('<H', data, 28)[0] <= 24
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 26:
+        if data[25] not in (0, 2, 3): # Grayscale, RGB and palette color types
+            return False
+        pos = 8
+        while pos + 8 <= len(data): # tRNS chunk (transparency) must come before image data
+            length, chunk_type = struct.unpack_from('>I4s', data, pos)
+            if chunk_type == b'tRNS':
+                return False
+            if chunk_type == b'IDAT':
+                return True
+            pos += length + 12
+    return False
+
+
 def is_active(materials, mat_name, image, opaque_images):
     if mat_name not in materials:
         return image not in opaque_images
@@ -243,7 +294,7 @@ def add_core_mesh(obj_list, vpx_name, vpx_subpart, core_mesh, target_col, materi
     if ';' not in obj.vlmSettings.vpx_object and obj.vlmSettings.import_transform:
         obj.location = (global_scale * x, -global_scale * y, global_scale * z)
         obj.scale = (global_scale * x_size, global_scale * y_size, global_scale * z_size)
-        obj.rotation_euler = mathutils.Euler((0.0, 0.0, -radians(rot_z)), 'XYZ')
+        obj.rotation_euler = (0.0, 0.0, -radians(rot_z))
     obj_list.append(obj.name)
     return obj
     
@@ -252,12 +303,10 @@ def load_point(item_data):
     sub_data = item_data.child_reader()
     x = y = z = tex_coord = 0
     smooth = False
-    point_skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'SLNG')
     while not sub_data.is_eof():
         sub_data.next()
         if sub_data.tag == 'VCEN':
-            x = sub_data.get_float()
-            y = sub_data.get_float()
+            x, y = sub_data.unpack(VEC2)
         elif sub_data.tag == 'POSZ':
             z = sub_data.get_float()
         elif sub_data.tag == 'SMTH':
@@ -266,12 +315,95 @@ def load_point(item_data):
             auto_tex = sub_data.get_bool()
         elif sub_data.tag == 'TEXC':
             tex_coord = sub_data.get_float()
-        elif sub_data.tag in point_skipped:
+        elif sub_data.tag in POINT_SKIPPED_TAGS:
             sub_data.skip_tag()
     item_data.skip(sub_data.pos)
     return [x, y, z, smooth, auto_tex, tex_coord]
 
 
+def compute_auto_tex_coords(xy, auto_tex, tex_coords):
+    '''
+    Interpolate the texture coordinate of the points flagged as automatic, along the (cyclic) curve length,
+    between the surrounding points that have a fixed texture coordinate. Returns the updated coordinates.
+    '''
+    n_points = len(xy)
+    delta = xy - np.roll(xy, -1, axis=0)
+    xpos = np.zeros(n_points + 1)
+    np.cumsum(np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]), out=xpos[1:])
+    xpos /= xpos[-1]
+    # Each point is interpolated between the last fixed point before it (or the start with u=0) and the next one (or the end with u=1)
+    fixed = np.flatnonzero(~auto_tex)
+    segment = np.searchsorted(fixed, np.arange(n_points), side='right')
+    start = np.concatenate(([0], fixed))[segment]
+    end = np.concatenate((fixed, [n_points]))[segment]
+    u_start = np.concatenate(([0.0], tex_coords[fixed]))[segment]
+    u_end = np.concatenate((tex_coords[fixed], [1.0]))[segment]
+    span = xpos[end] - xpos[start]
+    degenerated = span == 0
+    span[degenerated] = 1.0
+    u = u_start + (u_end - u_start) * (xpos[:n_points] - xpos[start]) / span
+    u[degenerated] = u_start[degenerated]
+    return u
+
+
+def compute_wall_split_normals(loop_n, poly_n, loop_total, side_loops, sharp_loops):
+    '''
+    Compute the custom split normals of a wall mesh: top and bottom faces are flat, sides are smoothed horizontally,
+    except on sharp edges where the polygon normal is used. Normals are given and returned as (n, 3) arrays.
+    '''
+    normals = np.zeros((len(loop_n), 3), dtype=np.float32)
+    top_bottom_loops = ~side_loops
+    normals[top_bottom_loops, 2] = np.sign(loop_n[top_bottom_loops, 2])
+    side_n = np.where(sharp_loops[:, None], np.repeat(poly_n, loop_total, axis=0), loop_n)[side_loops]
+    side_n[:, 2] = 0
+    length = np.linalg.norm(side_n, axis=1, keepdims=True)
+    normals[side_loops] = np.divide(side_n, length, out=np.zeros_like(side_n), where=length > 0)
+    return normals
+
+
+def compute_wall_side_u(u, uv_pt1, uv_pt2, tex_coords, epsilon):
+    '''
+    Remap the default u coordinate of wall sides (point index / nb points, 0 = first point, 1 = cyclicly first point)
+    to the texture coordinates of the curve points. The 2 reference points ([distance, point index, u]) are used
+    to identify the first point and the winding of the default unwrapping.
+    '''
+    n_points = len(tex_coords)
+    # For wall height of 0, uv_pt2[1] == uv_pt1[1], resulting in degenerate UV generation
+    if uv_pt2[1] == uv_pt1[1]:
+        u_winding = u0 = 1
+    else:
+        if uv_pt1[1] > uv_pt2[1]:
+            uv_pt1, uv_pt2 = uv_pt2, uv_pt1
+        # check if going forward from first to second points, match with increasing u accordingly, if not then we need to go backward
+        tu = (uv_pt1[2] + (uv_pt2[1] - uv_pt1[1]) / n_points) % 1.0
+        u_winding = 1 if abs(tu - uv_pt2[2]) < epsilon else -1
+        u0 = uv_pt1[2] - u_winding * uv_pt1[1] / n_points # u for first point
+    p = np.mod((u - u0) * n_points * u_winding, n_points)
+    i_a = p.astype(np.int32)
+    rel = p - i_a
+    i_a %= n_points
+    i_b = (i_a + 1) % n_points
+    return tex_coords[i_a] + rel * (tex_coords[i_b] - tex_coords[i_a])
+
+
+def compute_path_normals(co):
+    '''
+    Compute the cumulated length along a path of (n, 2) or (n, 3) points, and the path normals in the xy plane.
+    Normals are the cross product of the centered tangent with the z axis, (ty, -tx, 0), and are zero at degenerated points.
+    '''
+    ratios = np.concatenate(((0.0,), np.cumsum(np.linalg.norm(np.diff(co, axis=0), axis=1))))
+    tangents = np.empty_like(co)
+    tangents[1:-1] = co[2:] - co[:-2]
+    tangents[0] = co[1] - co[0]
+    tangents[-1] = co[-1] - co[-2]
+    normals = np.zeros_like(co)
+    normals[:, 0] = tangents[:, 1]
+    normals[:, 1] = -tangents[:, 0]
+    normals_length = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals /= np.where(normals_length > 0, normals_length, 1)
+    return ratios, normals
+
+
 def create_curve(curve_name, points, cyclic, flat, global_scale, curve_resolution=6):
     # Create the curve object
     curve = bpy.data.curves.new(curve_name, type='CURVE')
@@ -292,41 +424,347 @@ def create_curve(curve_name, points, cyclic, flat, global_scale, curve_resolutio
         curve.use_fill_caps = True
         for i, p in enumerate(points):
             polyline.bezier_points[i].co = (p[0] * global_scale, -p[1] * global_scale, p[2] * global_scale)
-    for i, p in enumerate(points):
-        if p[3]:
-            polyline.bezier_points[i].handle_right_type = polyline.bezier_points[i].handle_left_type = 'AUTO'
-        else:
-            polyline.bezier_points[i].handle_right_type = polyline.bezier_points[i].handle_left_type = 'VECTOR'
+    for bp, p in zip(polyline.bezier_points, points):
+        bp.handle_right_type = bp.handle_left_type = 'AUTO' if p[3] else 'VECTOR'
     # Update the points by computing the right U for points flagged as automatic 'texture coordinates'
-    length = 0
-    seg_lengths = []
-    for i, p in enumerate(points):
-        q = points[(i + 1) % len(points)]
-        seg_lengths.append(length)
-        length += math.sqrt((p[0]-q[0])*(p[0]-q[0]) + (p[1]-q[1])*(p[1]-q[1]))
-    xpos = [x/length for x in seg_lengths]
-    xpos.append(1.0)
-    n_points = len(points)
-    last_fixed_index = 0
-    last_fixed_u = 0
-    for i, p in enumerate(points):
-        if not p[4]:
-            for j in range(last_fixed_index, i):
-                if xpos[last_fixed_index] == xpos[i]:
-                    points[j][5] = last_fixed_u
-                else:
-                    points[j][5] = last_fixed_u + (p[5] - points[last_fixed_index][5]) * (xpos[j] - xpos[last_fixed_index]) / (xpos[i] - xpos[last_fixed_index])
-            last_fixed_index = i
-            last_fixed_u = p[5]
-    for j in range(last_fixed_index, n_points):
-        if xpos[last_fixed_index] == 1.0:
-            points[j][5] = last_fixed_u
-        else:
-            points[j][5] = last_fixed_u + (1.0 - points[last_fixed_index][5]) * (xpos[j] - xpos[last_fixed_index]) / (1.0 - xpos[last_fixed_index])
+    xy = np.array([(p[0], p[1]) for p in points], dtype=np.float64)
+    auto_tex = np.array([p[4] for p in points], dtype=bool)
+    tex_coords = np.array([p[5] for p in points], dtype=np.float64)
+    for p, u in zip(points, compute_auto_tex_coords(xy, auto_tex, tex_coords).tolist()):
+        p[5] = u
     return curve
 
 
+def curve_to_mesh(context, curve, merge_distance, angle_limit, use_dissolve_boundaries=False, bm=None):
+    '''
+    Convert a curve to a new mesh, then merge close vertices and dissolve coplanar faces.
+    This is done directly on data (without operators) to avoid mode switches and context updates.
+    A scratch bmesh may be given to be reused between calls, otherwise a temporary one is created.
+    '''
+    obj = bpy.data.objects.new(curve.name, curve)
+    context.scene.collection.objects.link(obj)
+    depsgraph = context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+    bpy.data.objects.remove(obj)
+    if bm is None:
+        work_bm = bmesh.new()
+    else:
+        work_bm = bm
+        work_bm.clear()
+    work_bm.from_mesh(mesh)
+    bmesh.ops.remove_doubles(work_bm, verts=work_bm.verts, dist=merge_distance)
+    bmesh.ops.dissolve_limit(work_bm, angle_limit=angle_limit, use_dissolve_boundaries=use_dissolve_boundaries, verts=work_bm.verts, edges=work_bm.edges, delimit={'NORMAL'})
+    work_bm.to_mesh(mesh)
+    if bm is None:
+        work_bm.free()
+    else:
+        work_bm.clear()
+    return mesh
+
+
+def mesh_from_arrays(mesh, verts, faces):
+    '''
+    Fill an empty mesh from a (n, 3) array of vertex positions and a (m, k) array of polygons of k vertices.
+    This is the same as mesh.from_pydata but with bulk copies instead of per element conversions.
+    '''
+    n_loops = faces.size
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set('co', np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.loops.add(n_loops)
+    mesh.loops.foreach_set('vertex_index', np.ascontiguousarray(faces, dtype=np.int32).ravel())
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set('loop_start', np.arange(0, n_loops, faces.shape[1], dtype=np.int32))
+    if bpy.app.version < (3, 6, 0):
+        mesh.polygons.foreach_set('loop_total', np.full(len(faces), faces.shape[1], dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+
+def read_item(item_data, handlers, skipped, **item):
+    '''
+    Read the tags of a game item, dispatching each of them to its handler from the given tag table.
+    Handlers store the read values in the item dict, initialized with the given defaults, which is returned.
+    '''
+    while not item_data.is_eof():
+        item_data.next()
+        handler = handlers.get(item_data.tag)
+        if handler is not None:
+            handler(item_data, item)
+        elif item_data.tag in skipped:
+            item_data.skip_tag()
+    return item
+
+
+def tag_value(key, getter):
+    return lambda item_data, item: item.__setitem__(key, getter(item_data))
+
+
+def tag_vec2(key_x, key_y):
+    def handler(item_data, item):
+        item[key_x], item[key_y] = item_data.unpack(VEC2)
+    return handler
+
+
+def tag_point(item_data, item):
+    item['points'].append(load_point(item_data))
+
+
+def tag_bumper_base_visible(item_data, item):
+    item['base_visible'] = item['ring_visible'] = item['skirt_visible'] = item_data.get_bool()
+
+
+def tag_padded_vec3(key):
+    def handler(item_data, item):
+        item[key] = item_data.unpack(PADDED_VEC3)
+    return handler
+
+
+def tag_rot_tra(index):
+    def handler(item_data, item):
+        item['rot_tra'][index] = item_data.get_float()
+    return handler
+
+
+def store_primitive_indices(item, data):
+    # Indices are 16 bits, unless the mesh has too many vertices to be indexed with them
+    dtype = '<u4' if item['n_vertices'] > 65535 else '<u2'
+    item['faces'] = np.frombuffer(data, dtype=dtype).reshape(-1, 3)
+
+
+def tag_primitive_compressed_indices(item_data, item):
+    # The game item stream is a memoryview, so the compressed data is not copied, and the output buffer is allocated at its final size
+    index_size = 4 if item['n_vertices'] > 65535 else 2
+    store_primitive_indices(item, zlib.decompress(item_data.get(item['compressed_indices_size']), bufsize=item['n_indices'] * index_size))
+
+
+def tag_primitive_indices(item_data, item):
+    index_size = 4 if item['n_vertices'] > 65535 else 2
+    store_primitive_indices(item, item_data.get(item['n_indices'] * index_size))
+
+
+def store_primitive_vertices(item, data):
+    # Vertex records are 8 floats: position, normal and uv, in VPX coordinates
+    d = np.frombuffer(data, dtype='<f4').reshape(-1, 8)
+    item['vertices'] = -d[:, 0:3]
+    item['normals'] = -d[:, 3:6]
+    uvs = d[:, 6:8].copy()
+    uvs[:, 1] = 1.0 - uvs[:, 1]
+    item['uvs'] = uvs
+
+
+def tag_primitive_compressed_vertices(item_data, item):
+    store_primitive_vertices(item, zlib.decompress(item_data.get(item['compressed_vertices_size']), bufsize=item['n_vertices'] * 8 * 4))
+
+
+def tag_primitive_vertices(item_data, item):
+    store_primitive_vertices(item, item_data.get(item['n_vertices'] * 8 * 4))
+
+
+BIFF_reader = biff_io.BIFF_reader
+
+# Tags of game items which are not used for the import
+POINT_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'SLNG'))
+WALL_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'PIID', 'HTEV', 'DROP', 'FLIP', 'ISBS', 'CLDW', 'TMON', 'TMIN', 'THRS', 'MAPH', 'SLMA', 'INNR', 'DSPT', 'SLGF', 'SLTH', 'ELAS', 'ELFO', 'WFCT', 'WSCT', 'OVPH', 'SLGA', 'DILI', 'DILB', 'REEN'))
+BUMPER_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'THRS', 'FORC', 'BSCT', 'RISP', 'RDLI', 'BVIS', 'HAHE', 'COLI', 'REEN'))
+TRIGGER_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'REEN', 'ANSP', 'THOT', 'EBLD'))
+LIGHT_SKIPPED_TAGS = frozenset(('HGHT', 'STTF', 'SHDW', 'FADE', 'VSBL', 'LOCK', 'LAYR', 'LANR', 'LVIS', 'STAT', 'TMON', 'TMIN', 'SHAP', 'BPAT', 'BINT', 'TRMS', 'BGLS', 'LIDB', 'FASP', 'FASD', 'STBM', 'SHRB', 'BMVA'))
+KICKER_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'KSCT', 'KHAC', 'KHHI', 'EBLD', 'FATH', 'LEMO'))
+GATE_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'GGFC', 'AFRC', 'GFRC', 'GAMI', 'GAMA', 'ELAS', 'TWWA', 'GCOL', 'REEN'))
+SPINNER_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'AFRC', 'SVIS', 'SELA', 'SMIN', 'SMAX', 'REEN'))
+RAMP_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'OVPH', 'MAPH', 'REEN', 'RADB', 'CLDR', 'RSCT', 'RFCT', 'ELAS', 'THRS', 'HTEV', 'WLHR', 'WLHL', 'TMIN', 'TMON'))
+PRIMITIVE_SKIPPED_TAGS = frozenset(('BMIN', 'BMAX', 'ZMSK', 'LMAP', 'REFL', 'RSTR', 'REFR', 'RTHI', 'PIID', 'LOCK', 'LAYR', 'LANR', 'LVIS', 'FALP', 'ADDB', 'PIDB', 'M3DN', 'OSNM', 'DIPT', 'OVPH', 'MAPH', 'EBFC', 'NRMA', 'SCOL', 'TVIS', 'DTXI', 'HTEV', 'THRS', 'ELAS', 'ELFO', 'RFCT', 'RSCT', 'EFUI', 'CORF', 'CLDR', 'ISTO', 'STRE', 'DILI', 'DILB', 'REEN', 'COLR'))
+FLASHER_SKIPPED_TAGS = frozenset(('PIID', 'LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'IDMD', 'DSPT', 'FLDB', 'FILT', 'FIAM'))
+RUBBER_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'OVPH', 'MAPH', 'REEN', 'ESIE', 'ESTR', 'CLDR', 'RSCT', 'RFCT', 'ELAS', 'ELFO', 'TMIN', 'TMON', 'HTHI', 'HTEV'))
+HIT_TARGET_SKIPPED_TAGS = frozenset(('LOCK', 'LAYR', 'LANR', 'LVIS', 'SLNG', 'OVPH', 'MAPH', 'RADE', 'TMIN', 'TMON', 'DRSP', 'ISDR', 'PIDB', 'REEN', 'DILI', 'DILB', 'CLDR', 'ELAS', 'ELFO', 'RSCT', 'RFCT', 'THRS', 'LEMO', 'HTEV'))
+
+WALL_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'TOMA': tag_value('top_material', lambda d: d.get_string().casefold()),
+    'SIMA': tag_value('side_material', lambda d: d.get_string().casefold()),
+    'IMAG': tag_value('top_image', BIFF_reader.get_string),
+    'SIMG': tag_value('side_image', BIFF_reader.get_string),
+    'VSBL': tag_value('top_visible', BIFF_reader.get_bool),
+    'SVBL': tag_value('side_visible', BIFF_reader.get_bool),
+    'HTBT': tag_value('height_bottom', BIFF_reader.get_float),
+    'HTTP': tag_value('height_top', BIFF_reader.get_float),
+    'DPNT': tag_point,
+}
+
+BUMPER_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VCEN': tag_vec2('x', 'y'),
+    'RADI': tag_value('radius', BIFF_reader.get_float),
+    'MATR': tag_value('cap_material', BIFF_reader.get_string),
+    'RIMA': tag_value('ring_material', BIFF_reader.get_string),
+    'BAMA': tag_value('base_material', BIFF_reader.get_string),
+    'SKMA': tag_value('skirt_material', BIFF_reader.get_string),
+    'HISC': tag_value('height_scale', BIFF_reader.get_float),
+    'ORIN': tag_value('orientation', BIFF_reader.get_float),
+    'SURF': tag_value('surface', BIFF_reader.get_string),
+    'CAVI': tag_value('cap_visible', BIFF_reader.get_bool),
+    'BSVS': tag_bumper_base_visible,
+    'RIVS': tag_value('ring_visible', BIFF_reader.get_bool),
+    'SKVS': tag_value('skirt_visible', BIFF_reader.get_bool),
+}
+
+TRIGGER_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VCEN': tag_vec2('x', 'y'),
+    'SHAP': tag_value('shape', BIFF_reader.get_u32),
+    'RADI': tag_value('radius', BIFF_reader.get_float),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'SCAX': tag_value('scale_x', BIFF_reader.get_float),
+    'SCAY': tag_value('scale_y', BIFF_reader.get_float),
+    'WITI': tag_value('wire_thickness', BIFF_reader.get_float),
+    'ROTA': tag_value('orientation', BIFF_reader.get_float),
+    'SURF': tag_value('surface', BIFF_reader.get_string),
+    'VSBL': tag_value('visible', BIFF_reader.get_bool),
+    'DPNT': tag_point,
+}
+
+LIGHT_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VCEN': tag_vec2('x', 'y'),
+    'COLR': tag_value('color', BIFF_reader.get_color),
+    'COL2': tag_value('color2', BIFF_reader.get_color),
+    'BWTH': tag_value('intensity', BIFF_reader.get_float),
+    'SHBM': tag_value('show_bulb', BIFF_reader.get_bool),
+    'BGLS': tag_value('is_backglass', BIFF_reader.get_bool),
+    'IMMO': tag_value('is_passthrough', BIFF_reader.get_bool),
+    'BMSC': tag_value('bulb_mesh_radius', BIFF_reader.get_float),
+    'BULT': tag_value('bulb', BIFF_reader.get_bool),
+    'BHHI': tag_value('halo_height', BIFF_reader.get_float),
+    'RADI': tag_value('falloff', BIFF_reader.get_float),
+    'FAPO': tag_value('falloff_power', BIFF_reader.get_float),
+    'SURF': tag_value('surface', BIFF_reader.get_string),
+    'IMG1': tag_value('image', BIFF_reader.get_string),
+    'DPNT': tag_point,
+}
+
+KICKER_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VCEN': tag_vec2('x', 'y'),
+    'RADI': tag_value('radius', BIFF_reader.get_float),
+    'KORI': tag_value('orientation', BIFF_reader.get_float),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'TYPE': tag_value('type', BIFF_reader.get_u32),
+    'SURF': tag_value('surface', BIFF_reader.get_string),
+}
+
+GATE_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VCEN': tag_vec2('x', 'y'),
+    'GATY': tag_value('type', BIFF_reader.get_u32),
+    'LGTH': tag_value('length', BIFF_reader.get_float),
+    'HGTH': tag_value('height', BIFF_reader.get_float),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'ROTA': tag_value('orientation', BIFF_reader.get_float),
+    'SURF': tag_value('surface', BIFF_reader.get_string),
+    'GSUP': tag_value('show_bracket', BIFF_reader.get_bool),
+    'GVSB': tag_value('visible', BIFF_reader.get_bool),
+}
+
+SPINNER_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VCEN': tag_vec2('x', 'y'),
+    'LGTH': tag_value('length', BIFF_reader.get_float),
+    'HIGH': tag_value('height', BIFF_reader.get_float),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'IMGF': tag_value('image', BIFF_reader.get_string),
+    'ROTA': tag_value('orientation', BIFF_reader.get_float),
+    'SURF': tag_value('surface', BIFF_reader.get_string),
+    'SSUP': tag_value('show_bracket', BIFF_reader.get_bool),
+    'SVIS': tag_value('visible', BIFF_reader.get_bool),
+}
+
+RAMP_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'HTBT': tag_value('height_bottom', BIFF_reader.get_float),
+    'HTTP': tag_value('height_top', BIFF_reader.get_float),
+    'WDBT': tag_value('width_bottom', BIFF_reader.get_float),
+    'WDTP': tag_value('width_top', BIFF_reader.get_float),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'IMAG': tag_value('image', BIFF_reader.get_string),
+    'IMGW': tag_value('image_on_walls', BIFF_reader.get_bool),
+    'ALGN': tag_value('image_alignment', BIFF_reader.get_u32),
+    'TYPE': tag_value('ramp_type', BIFF_reader.get_u32),
+    'RVIS': tag_value('visible', BIFF_reader.get_bool),
+    'RADI': tag_value('wire_diameter', BIFF_reader.get_float),
+    'RADX': tag_value('wire_distance_x', BIFF_reader.get_float),
+    'RADY': tag_value('wire_distance_y', BIFF_reader.get_float),
+    'WVHR': tag_value('right_wall_height', BIFF_reader.get_float),
+    'WVHL': tag_value('left_wall_height', BIFF_reader.get_float),
+    'DPNT': tag_point,
+}
+
+PRIMITIVE_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'IMAG': tag_value('image', BIFF_reader.get_string),
+    'TVIS': tag_value('visible', BIFF_reader.get_bool),
+    'VPOS': tag_padded_vec3('position'),
+    'VSIZ': tag_padded_vec3('size'),
+    'U3DM': tag_value('use_3d_mesh', BIFF_reader.get_bool),
+    'SIDS': tag_value('n_sides', BIFF_reader.get_u32),
+    **{f'RTV{i}': tag_rot_tra(i) for i in range(9)},
+    'M3VN': tag_value('n_vertices', BIFF_reader.get_u32),
+    'M3CJ': tag_value('compressed_indices_size', BIFF_reader.get_u32),
+    'M3CI': tag_primitive_compressed_indices,
+    'M3DI': tag_primitive_indices,
+    'M3FN': tag_value('n_indices', BIFF_reader.get_u32),
+    'M3CY': tag_value('compressed_vertices_size', BIFF_reader.get_u32),
+    'M3CX': tag_primitive_compressed_vertices,
+    'M3DX': tag_primitive_vertices,
+}
+
+FLASHER_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'FHEI': tag_value('height', BIFF_reader.get_float),
+    'FLAX': tag_value('x', BIFF_reader.get_float),
+    'FLAY': tag_value('y', BIFF_reader.get_float),
+    'FROX': tag_value('rot_x', BIFF_reader.get_float),
+    'FROY': tag_value('rot_y', BIFF_reader.get_float),
+    'FROZ': tag_value('rot_z', BIFF_reader.get_float),
+    'COLR': tag_value('color', BIFF_reader.get_color),
+    'IMAG': tag_value('image_a', BIFF_reader.get_string),
+    'IMAB': tag_value('image_b', BIFF_reader.get_string),
+    'FALP': tag_value('alpha', BIFF_reader.get_32),
+    'MOVA': tag_value('modulate_vs_add', BIFF_reader.get_float),
+    'FVIS': tag_value('visible', BIFF_reader.get_bool),
+    'ADDB': tag_value('additive_blend', BIFF_reader.get_bool),
+    'ALGN': tag_value('image_alignment', BIFF_reader.get_u32),
+    'DPNT': tag_point,
+}
+
+RUBBER_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'HTTP': tag_value('height', BIFF_reader.get_float),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'IMAG': tag_value('image', BIFF_reader.get_string),
+    'RVIS': tag_value('visible', BIFF_reader.get_bool),
+    'WDTP': tag_value('thickness', BIFF_reader.get_u32),
+    'ROTX': tag_value('rotate_x', BIFF_reader.get_float),
+    'ROTY': tag_value('rotate_y', BIFF_reader.get_float),
+    'ROTZ': tag_value('rotate_z', BIFF_reader.get_float),
+    'DPNT': tag_point,
+}
+
+HIT_TARGET_TAGS = {
+    'NAME': tag_value('name', BIFF_reader.get_wide_string),
+    'VPOS': tag_padded_vec3('position'),
+    'VSIZ': tag_padded_vec3('size'),
+    'ROTZ': tag_value('rot_z', BIFF_reader.get_float),
+    'IMAG': tag_value('image', BIFF_reader.get_string),
+    'MATR': tag_value('material', BIFF_reader.get_string),
+    'TRTY': tag_value('target_type', BIFF_reader.get_u32),
+    'TVIS': tag_value('visible', BIFF_reader.get_bool),
+}
+
+
 def read_vpx(op, context, filepath):
+    # Dependencies which need a custom install (not included in the Blender install), only loaded when importing a table
+    from PIL import Image
+    import olefile
+
     logger.info("reading ", filepath)
 
     if not os.path.isfile(filepath):
@@ -351,6 +789,8 @@ def read_vpx(op, context, filepath):
     bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
     
     vlm_utils.load_library()
+    # Core materials assigned to table objects, looked up once instead of for each object
+    core_materials = {name: bpy.data.materials[name] for name in ("VPX.Core.Mat.Plastic", "VPX.Core.Mat.Plastic.NoAlpha", "VPX.Core.Mat.Invisible", "VPX.Core.Mat.Inserts.Back")}
     
     created_objects = []
     with olefile.OleFileIO(filepath) as ole:
@@ -372,7 +812,6 @@ def read_vpx(op, context, filepath):
         n_collections = 0
         playfield_material = ""
         playfield_mesh = ""
-        skipped = ()
         materials = {}
         ring_mat = VPX_Material()
         ring_mat.name = 'VPX.Mat.Ring'
@@ -386,26 +825,31 @@ def read_vpx(op, context, filepath):
             if game_data.tag == 'MASI':
                 n_materials = game_data.get_32()
             elif game_data.tag == 'MATE':
-                for i in range(n_materials):
-                    name = game_data.get_str(32).rstrip('\x00')
+                mates = np.frombuffer(game_data.get(n_materials * MATERIAL_DTYPE.itemsize), dtype=MATERIAL_DTYPE)
+                colors = {}
+                for field in ('base_color', 'glossy_color', 'clearcoat_color'):
+                    rgba = BYTE_TO_UNIT[mates[field]]
+                    rgba[:, 3] = 1.0 # Material colors are stored without alpha
+                    colors[field] = [tuple(c) for c in rgba.tolist()]
+                glossy_image_lerps = BYTE_TO_UNIT[mates['glossy_image_lerp']].tolist()
+                thicknesses = BYTE_TO_UNIT[mates['thickness']].tolist()
+                edge_alphas = BYTE_TO_UNIT[mates['opacity_active_edge_alpha'] & 0x7F].tolist()
+                for i, mate in enumerate(mates):
+                    name = mate['name'].split(b'\x00', 1)[0].decode('latin_1')
                     mat = VPX_Material()
                     mat.name = name
-                    mat.base_color = game_data.get_color()
-                    mat.glossy_color = game_data.get_color()
-                    mat.clearcoat_color = game_data.get_color()
-                    mat.wrap_lighting = game_data.get_float()
-                    mat.is_metal = game_data.get_bool()
-                    mat.roughness = game_data.get_float()
-                    mat.glossy_image_lerp = game_data.get_u8() / 255.0
-                    game_data.skip(3)
-                    mat.edge = game_data.get_float()
-                    mat.thickness = game_data.get_u8() / 255
-                    game_data.skip(3)
-                    mat.opacity = game_data.get_float()
-                    opacity_active_edge_alpha = game_data.get_u8()
-                    game_data.skip(3)
-                    mat.opacity_active = (opacity_active_edge_alpha & 0x01) != 0
-                    mat.edge_alpha = (opacity_active_edge_alpha & 0x7F) / 255.0
+                    mat.base_color = colors['base_color'][i]
+                    mat.glossy_color = colors['glossy_color'][i]
+                    mat.clearcoat_color = colors['clearcoat_color'][i]
+                    mat.wrap_lighting = float(mate['wrap_lighting'])
+                    mat.is_metal = bool(mate['is_metal'])
+                    mat.roughness = float(mate['roughness'])
+                    mat.glossy_image_lerp = glossy_image_lerps[i]
+                    mat.edge = float(mate['edge'])
+                    mat.thickness = thicknesses[i]
+                    mat.opacity = float(mate['opacity'])
+                    mat.opacity_active = bool(mate['opacity_active_edge_alpha'] & 0x01)
+                    mat.edge_alpha = edge_alphas[i]
                     materials[name.casefold()] = mat
             elif game_data.tag == 'EIMG':
                 env_image = game_data.get_string()
@@ -446,7 +890,7 @@ def read_vpx(op, context, filepath):
                 code = game_data.get_string()
                 game_data.pos = code_pos
                 game_data.skip(code_size)
-                movables = {match[0] for match in re.compile(r'([a-zA-Z][[a-zA-Z0-9_]+)\.(rotx-zz|rotandtra0-9|transx-z|objrotx-z|size_x-z)').findall(code.lower())}
+                movables = set(MOVABLE_RE.findall(code.lower()))
                 logger.info(f'. Following objects were identified as movable by the script: {movables}')
             else:
                 game_data.skip_tag()
@@ -456,6 +900,7 @@ def read_vpx(op, context, filepath):
         # Read the textures
         opaque_images = ['']
         alpha_images = ['']
+        analyzed_images = {}
         for index in range(n_images):
             image_data = biff_io.BIFF_reader(ole.openstream(f"GameStg/Image{index}").read())
             vpx_name = ""
@@ -508,23 +953,32 @@ def read_vpx(op, context, filepath):
             else:
                 image = bpy.data.images.new(name, width, height, alpha=True)
             if data is not None:
-                try:
-                    im = Image.open(io.BytesIO(data))
-                    if im.format == 'WEBP':
-                        byte_io = io.BytesIO()
-                        im.save(byte_io, 'PNG')
-                        data = byte_io.getvalue()
-                        size = len(data)
-                    extrema = im.getextrema()
-                    if len(extrema) < 4 or extrema[3][0] == 255:
-                        image.alpha_mode = 'NONE' # Identify opaque image including images with an opaque alpha channel
-                        opaque_images.append(vpx_name)
+                # The same bitmap is often stored under different names, so only analyze each image data once
+                data_hash = hashlib.blake2b(data, digest_size=16).digest()
+                if data_hash not in analyzed_images:
+                    opaque = None
+                    if is_opaque_image_format(data):
+                        opaque = True # No need to decode images which can not hold transparency
                     else:
-                        image.alpha_mode = 'STRAIGHT' 
-                        alpha_images.append(vpx_name)
-                except OSError:
-                    logger.info(f"cannot load {vpx_name} initially imported from {path}")
-                image.pack(data=data, data_len=size)
+                        try:
+                            im = Image.open(io.BytesIO(data))
+                            if im.format == 'WEBP':
+                                byte_io = io.BytesIO()
+                                im.save(byte_io, 'PNG')
+                                data = byte_io.getvalue()
+                            extrema = im.getextrema()
+                            opaque = len(extrema) < 4 or extrema[3][0] == 255 # Identify opaque image including images with an opaque alpha channel
+                        except OSError:
+                            logger.info(f"cannot load {vpx_name} initially imported from {path}")
+                    analyzed_images[data_hash] = (opaque, data)
+                opaque, data = analyzed_images[data_hash]
+                if opaque is True:
+                    image.alpha_mode = 'NONE'
+                    opaque_images.append(vpx_name)
+                elif opaque is False:
+                    image.alpha_mode = 'STRAIGHT' 
+                    alpha_images.append(vpx_name)
+                image.pack(data=data, data_len=len(data))
             image.source = 'FILE'
         logger.info(f'. Following images are fully opaque: {opaque_images}')
         logger.info(f'. Following images have transparent pixels: {alpha_images}')
@@ -575,46 +1029,17 @@ def read_vpx(op, context, filepath):
         surface_offsets = {}
         shifted_objects = []
         insert_cups = []
+        scratch_bm = bmesh.new() # Reused for the mesh cleanups of all items
         for index in range(n_items):
             name = ""
-            item_data = biff_io.BIFF_reader(ole.openstream(f"GameStg/GameItem{index}").read())
+            item_data = biff_io.BIFF_reader(memoryview(ole.openstream(f"GameStg/GameItem{index}").read()))
             item_type = item_data.get_32()
 
             if item_type == 0: # Surface (wall)
-                top_material = ""
-                side_material = ""
-                top_image = ""
-                side_image = ""
-                top_visible = False
-                side_visible = False
-                height_bottom = 0.0
-                height_top = 0.0
-                points = []
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'PIID', 'HTEV', 'DROP', 'FLIP', 'ISBS', 'CLDW', 'TMON', 'TMIN', 'THRS', 'MAPH', 'SLMA', 'INNR', 'DSPT', 'SLGF', 'SLTH', 'ELAS', 'ELFO', 'WFCT', 'WSCT', 'OVPH', 'SLGA', 'DILI', 'DILB', 'REEN')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'TOMA':
-                        top_material = item_data.get_string().casefold()
-                    elif item_data.tag == 'SIMA':
-                        side_material = item_data.get_string().casefold()
-                    elif item_data.tag == 'IMAG':
-                        top_image = item_data.get_string()
-                    elif item_data.tag == 'SIMG':
-                        side_image = item_data.get_string()
-                    elif item_data.tag == 'VSBL':
-                        top_visible = item_data.get_bool()
-                    elif item_data.tag == 'SVBL':
-                        side_visible = item_data.get_bool()
-                    elif item_data.tag == 'HTBT':
-                        height_bottom = item_data.get_float()
-                    elif item_data.tag == 'HTTP':
-                        height_top = item_data.get_float()
-                    elif item_data.tag == 'DPNT':
-                        points.append(load_point(item_data))
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, WALL_TAGS, WALL_SKIPPED_TAGS, name=name, top_material="", side_material="", top_image="", side_image="", top_visible=False, side_visible=False, height_bottom=0.0, height_top=0.0, points=[])
+                name, points = item['name'], item['points']
+                top_material, side_material, top_image, side_image = item['top_material'], item['side_material'], item['top_image'], item['side_image']
+                top_visible, side_visible, height_bottom, height_top = item['top_visible'], item['side_visible'], item['height_bottom'], item['height_top']
 
                 update_mode = needs_update(context, name, created_objects, 0, 0, global_scale * 0.5 * (height_top + height_bottom))
                 if update_mode < 2: continue
@@ -625,131 +1050,110 @@ def read_vpx(op, context, filepath):
                 # limit resolution for plastics, since if too high, it breaks Blender's bevel operator
                 curve = create_curve(f"VPX.Curve.{name}", points, True, True, global_scale, curve_resolution=3 if is_plastic else 6)
                 curve.extrude = extrude_height
-                obj = bpy.data.objects.new(f"VPX.Temp", curve)
-                scene_col.objects.link(obj)
-                
-                bpy.ops.object.select_all(action='DESELECT')
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                bpy.ops.object.convert(target='MESH')
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.mesh.remove_doubles(threshold=global_scale*0.5)
-                bpy.ops.mesh.dissolve_limited(angle_limit=radians(2.0), use_dissolve_boundaries=True)
-                bpy.ops.object.mode_set(mode='OBJECT')
-                bpy.ops.object.shade_smooth()
-                obj = context.view_layer.objects.active
-                mesh = obj.data
+                # Curve points in mesh space with their sharpness and texture coordinate
+                pts_scaled = np.array([(p[0] * global_scale, -p[1] * global_scale, p[3], p[5]) for p in points])
+                pts_xy = np.ascontiguousarray(pts_scaled[:, :2])
+                pts_smooth = pts_scaled[:, 2].astype(bool)
+                pts_u = pts_scaled[:, 3]
+                mesh = curve_to_mesh(context, curve, global_scale * 0.5, radians(2.0), use_dissolve_boundaries=True, bm=scratch_bm)
+                mesh.polygons.foreach_set('use_smooth', [True] * len(mesh.polygons))
                 # Set bevelling on top and bottom edges
                 if bpy.app.version < (3, 4, 0):
                     mesh.use_customdata_edge_bevel = True
+                # Mesh data is gathered once, and shared by the bevel, normal, uv and material passes
+                vco = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+                mesh.vertices.foreach_get('co', vco)
+                vco = vco.reshape(-1, 3)
+                edges_v = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+                mesh.edges.foreach_get('vertices', edges_v)
+                edges_v = edges_v.reshape(-1, 2)
+                weights = (np.abs(vco[edges_v[:, 0], 2] - vco[edges_v[:, 1], 2]) < 0.01 * global_scale).astype(np.float32)
                 if bpy.app.version >= (4, 0, 0):
                     bevel_weight_attr = mesh.attributes.new("bevel_weight_edge", "FLOAT", "EDGE")
-                    for idx, edge in enumerate(mesh.edges):
-                        if abs(mesh.vertices[edge.vertices[0]].co.z - mesh.vertices[edge.vertices[1]].co.z) < 0.01 * global_scale:
-                            bevel_weight_attr.data[idx].value = 1.0
-                        else:
-                            bevel_weight_attr.data[idx].value = 0.0
+                    bevel_weight_attr.data.foreach_set('value', weights)
                 else:
                     #elif not mesh.has_bevel_weight_edge:
                     #    bpy.ops.mesh.customdata_bevel_weight_edge_add()
-                    for edge in mesh.edges:
-                        if abs(mesh.vertices[edge.vertices[0]].co.z - mesh.vertices[edge.vertices[1]].co.z) < 0.01 * global_scale:
-                            edge.bevel_weight = 1.0
-                        else:
-                            edge.bevel_weight = 0.0
-                # Compute split normals, trying to get the right smoothing
-                mesh.calc_normals_split()
-                normals = [(0,0,0) for i in mesh.loops]
+                    mesh.edges.foreach_set('bevel_weight', weights)
                 epsilon = 0.00001 * global_scale
                 uv_layer = mesh.uv_layers.active.data
+                n_loops = len(mesh.loops)
+                loop_vidx = np.empty(n_loops, dtype=np.int32)
+                mesh.loops.foreach_get('vertex_index', loop_vidx)
+                loop_co = vco[loop_vidx]
+                loop_uv = np.empty(n_loops * 2, dtype=np.float32)
+                uv_layer.foreach_get('uv', loop_uv)
+                loop_u = loop_uv[0::2]
+                poly_n = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+                mesh.polygons.foreach_get('normal', poly_n)
+                loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+                mesh.polygons.foreach_get('loop_total', loop_total)
+                # Top / Side / Bottom polygon masks, and the corresponding loop masks
+                top_polys = poly_n[2::3] > 0.5
+                bottom_polys = poly_n[2::3] < -0.5
+                side_polys = ~(top_polys | bottom_polys)
+                side_loops = np.repeat(side_polys, loop_total)
+                top_bottom_loops = ~side_loops
+                # Look up the 2 nearest curve points of each side vertex, and if it lies on a sharp curve point
+                side_vidx, side_vert = np.unique(loop_vidx[side_loops], return_inverse=True)
+                kd = mathutils.kdtree.KDTree(len(points))
+                for i, (px, py) in enumerate(pts_xy):
+                    kd.insert((px, py, 0), i)
+                kd.balance()
+                nearest_d2 = np.full((len(side_vidx), 2), np.inf)
+                nearest_i = np.full((len(side_vidx), 2), -1)
+                vert_sharp = np.zeros(len(side_vidx), dtype=bool)
+                sharp_radius = math.sqrt(epsilon)
+                for j, (px, py) in enumerate(vco[side_vidx, :2].tolist()):
+                    hits = kd.find_n((px, py, 0), 2)
+                    for k, (_, i, d) in enumerate(hits):
+                        nearest_d2[j, k] = d * d
+                        nearest_i[j, k] = i
+                    # The nearest points are enough for the sharp test, unless more than 2 points are in range
+                    if len(hits) == 2 and hits[1][2] <= sharp_radius:
+                        hits = kd.find_range((px, py, 0), sharp_radius)
+                    vert_sharp[j] = any(d <= sharp_radius and not pts_smooth[i] for _, i, d in hits)
+                sharp_loops = np.zeros(n_loops, dtype=bool)
+                sharp_loops[side_loops] = vert_sharp[side_vert]
+                # Identify 2 different points from the original curve and store there uv unwrapping
+                # default u is a coordinate in the index coordinate system (point index / nb points)
+                side_u = loop_u[side_loops]
+                search = (side_u != 0) & (side_u != 1.0)
+                side_u, d2, nearest = side_u[search], nearest_d2[side_vert[search]], nearest_i[side_vert[search]]
                 uv_pt1 = [100000, -1, -1]
                 uv_pt2 = [100000, -1, -1]
-                for poly in mesh.polygons:
-                    for loop_index in poly.loop_indices:
-                        loop = mesh.loops[loop_index]
-                        pt = mesh.vertices[loop.vertex_index].co
-                        n = loop.normal
-                        if abs(poly.normal.z) > 0.5: # Top/Bottom sides
-                            n = mathutils.Vector((0, 0, n[2])).normalized()
-                        else: # Sides
-                            # Identify 2 different points from the original curve and store there uv unwrapping
-                            u,v = uv_layer[loop_index].uv # default u is a coordinate in the index coordinate system (point index / nb points)
-                            if u != 0 and u != 1.0:
-                                for i, p in enumerate(points):
-                                    d = (p[0] * global_scale - pt.x)*(p[0] * global_scale - pt.x) + (-p[1] * global_scale - pt.y)*(-p[1] * global_scale - pt.y)
-                                    if d < uv_pt1[0]:
-                                        if i == uv_pt1[1]:
-                                            uv_pt1[0] = d
-                                            uv_pt1[2] = u
-                                        elif i != uv_pt2[1] and u != uv_pt1[2] and u != uv_pt2[2]:
-                                            if uv_pt1[0] < uv_pt2[0]:
-                                                uv_pt2 = uv_pt1
-                                            uv_pt1 = [d, i, u]
-                                    if d < uv_pt2[0]:
-                                        if i == uv_pt2[1]:
-                                            uv_pt2[0] = d
-                                            uv_pt2[2] = u
-                                        elif i != uv_pt1[1] and u != uv_pt1[2] and u != uv_pt2[2]:
-                                            if uv_pt2[0] < uv_pt1[0]:
-                                                uv_pt1 = uv_pt2
-                                            uv_pt2 = [d, i, u]
-                            # Compute split normal for side
-                            n = mathutils.Vector((n[0], n[1], 0)).normalized()
-                            for i, p in enumerate(points): # Sharp edges
-                                d = (p[0] * global_scale - pt.x)*(p[0] * global_scale - pt.x) + (-p[1] * global_scale - pt.y)*(-p[1] * global_scale - pt.y)
-                                if d <= epsilon and not p[3]:
-                                    scale = math.sqrt(1.0 - n[2]*n[2])
-                                    n = mathutils.Vector((scale * poly.normal[0], scale * poly.normal[1], n[2])).normalized()
-                                    break
-                        normals[loop_index] = n
+                if len(side_u):
+                    l1 = np.argmin(d2[:, 0])
+                    i1 = nearest[l1, 0]
+                    uv_pt1 = [d2[l1, 0], i1, side_u[l1]]
+                    # Nearest point, other than the first one, from the loops with a different u
+                    k = (nearest[:, 0] == i1).astype(np.int32)
+                    rows = np.arange(len(k))
+                    d2 = np.where(side_u != side_u[l1], d2[rows, k], np.inf)
+                    l2 = np.argmin(d2)
+                    if np.isfinite(d2[l2]):
+                        uv_pt2 = [d2[l2], nearest[l2, k[l2]], side_u[l2]]
+                # Compute split normals, trying to get the right smoothing
+                mesh.calc_normals_split()
+                loop_n = np.empty(n_loops * 3, dtype=np.float32)
+                mesh.loops.foreach_get('normal', loop_n)
+                loop_n = loop_n.reshape(-1, 3)
+                normals = compute_wall_split_normals(loop_n, poly_n.reshape(-1, 3), loop_total, side_loops, sharp_loops)
                 mesh.use_auto_smooth = True
-                mesh.normals_split_custom_set(normals)
-                n_points = len(points)
-                # For wall height of 0, uv_pt2[1] == uv_pt1[1], resulting in degenerate UV generation
-                if uv_pt2[1] == uv_pt1[1]: 
-                    u_winding = u0 = 1
-                else:
-                    if uv_pt1[1] > uv_pt2[1]:
-                        tmp = uv_pt2
-                        uv_pt2 = uv_pt1
-                        uv_pt1 = tmp
-                    # check if going forward from first to second points, match with increasing u accordingly, if not then we need to go backward
-                    tu = (uv_pt1[2] + (uv_pt2[1] - uv_pt1[1]) / n_points) % 1.0
-                    if abs(tu - uv_pt2[2]) < epsilon: 
-                        u_winding = 1
-                    else:
-                        u_winding = -1
-                    u0 = uv_pt1[2] - u_winding * uv_pt1[1] / n_points # u for first point
-                def calc_u(points, pos):
-                    p = (pos - u0) * n_points * u_winding
-                    while p < 0:
-                        p += n_points
-                    i_a = int(p) % n_points
-                    i_b = (i_a + 1) % n_points
-                    rel = p - int(p)
-                    return points[i_a][5] + rel * (points[i_b][5] - points[i_a][5])
-                
-                uv_layer = mesh.uv_layers.active.data
-                for poly in mesh.polygons:
-                    if abs(poly.normal.z) > 0.5: # Top/Bottom sides
-                        if poly.normal.z > 0.5:
-                            poly.material_index  = 0 # Top
-                        else:
-                            poly.material_index  = 2 # Bottom
-                        for loop_index in poly.loop_indices:
-                            pt = mesh.vertices[mesh.loops[loop_index].vertex_index]
-                            uv_layer[loop_index].uv = ((pt.co.x - playfield_left) / playfield_width, (playfield_bottom + pt.co.y) / playfield_height)
-                    else:
-                        poly.material_index  = 1 # Side
-                        for loop_index in poly.loop_indices:
-                            u,v = uv_layer[loop_index].uv # default u is a coordinate in the index coordinate system (0 = first point,  u = point index / nb points, 1 = cyclicly first point)
-                            uv_layer[loop_index].uv = (calc_u(points, u), v)
+                mesh.normals_split_custom_set(normals.tolist())
+
+                material_index = np.ones(len(mesh.polygons), dtype=np.int32) # Side
+                material_index[top_polys] = 0 # Top
+                material_index[bottom_polys] = 2 # Bottom
+                mesh.polygons.foreach_set('material_index', material_index)
+                loop_uv = loop_uv.reshape(-1, 2)
+                loop_uv[top_bottom_loops, 0] = (loop_co[top_bottom_loops, 0] - playfield_left) / playfield_width
+                loop_uv[top_bottom_loops, 1] = (playfield_bottom + loop_co[top_bottom_loops, 1]) / playfield_height
+                loop_uv[side_loops, 0] = compute_wall_side_u(loop_uv[side_loops, 0].astype(np.float64), uv_pt1, uv_pt2, pts_u, epsilon)
+                uv_layer.foreach_set('uv', loop_uv.ravel())
 
-                scene_col.objects.unlink(obj)
-                
                 target_col = ACTIVE_COL if is_active(materials, top_material, top_image, opaque_images) else STATIC_COL
-                _, obj = update_object(context, name, '', obj.data, target_col if top_visible or side_visible else HIDDEN_COL)
+                _, obj = update_object(context, name, '', mesh, target_col if top_visible or side_visible else HIDDEN_COL)
                 update_location(obj, 0, 0, global_scale * 0.5 * (height_top + height_bottom))
 
                 bevel_size = min(extrude_height, global_scale * opt_bevel_plastics)
@@ -765,20 +1169,25 @@ def read_vpx(op, context, filepath):
 
                 while len(obj.data.materials) < 3:
                     obj.data.materials.append(None)
-                if opt_process_plastics and is_plastic:
+                # Each slot is assigned once: top (0), side (1), bottom (2)
+                process_plastic = opt_process_plastics and is_plastic
+                if not top_visible:
+                    obj.data.materials[0] = core_materials["VPX.Core.Mat.Invisible"]
+                elif process_plastic:
                     # Use alpha plastic glass (no IOR, alpha bake suited for alpha blended in VPX) on top if the image is not opaque
-                    obj.data.materials[0] = bpy.data.materials["VPX.Core.Mat.Plastic" if top_image not in opaque_images else "VPX.Core.Mat.Plastic.NoAlpha"]
-                    obj.data.materials[1] = bpy.data.materials["VPX.Core.Mat.Plastic.NoAlpha"] # Normal plastic glass (with IOR, opaque bake)
-                    update_material(obj.data, 2, materials, top_material, top_image, opt_plastic_translucency)
+                    obj.data.materials[0] = core_materials["VPX.Core.Mat.Plastic" if top_image not in opaque_images else "VPX.Core.Mat.Plastic.NoAlpha"]
                 else:
                     update_material(obj.data, 0, materials, top_material, top_image)
-                    update_material(obj.data, 1, materials, side_material, side_image)
-                    obj.data.materials[2] = bpy.data.materials["VPX.Core.Mat.Invisible"]
-                if not top_visible:
-                    obj.data.materials[0] = bpy.data.materials["VPX.Core.Mat.Invisible"]
-                    obj.data.materials[2] = bpy.data.materials["VPX.Core.Mat.Invisible"]
                 if not side_visible:
-                    obj.data.materials[1] = bpy.data.materials["VPX.Core.Mat.Invisible"]
+                    obj.data.materials[1] = core_materials["VPX.Core.Mat.Invisible"]
+                elif process_plastic:
+                    obj.data.materials[1] = core_materials["VPX.Core.Mat.Plastic.NoAlpha"] # Normal plastic glass (with IOR, opaque bake)
+                else:
+                    update_material(obj.data, 1, materials, side_material, side_image)
+                if top_visible and process_plastic:
+                    update_material(obj.data, 2, materials, top_material, top_image, opt_plastic_translucency)
+                else:
+                    obj.data.materials[2] = core_materials["VPX.Core.Mat.Invisible"]
                              
             elif item_type == 1: # Flipper
                 # FIXME add an option to create a cylinder in the indirect baking to get the base projected shadow
@@ -794,45 +1203,12 @@ def read_vpx(op, context, filepath):
                 pass
             
             elif item_type == 5: # Bumper
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'THRS', 'FORC', 'BSCT', 'RISP', 'RDLI', 'BVIS', 'HAHE', 'COLI', 'REEN')
-                ring_material = ring_mat.name
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VCEN':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                    elif item_data.tag == 'RADI':
-                        radius = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        cap_material = item_data.get_string()
-                    elif item_data.tag == 'RIMA':
-                        ring_material = item_data.get_string()
-                        if ring_material == '':
-                            ring_material = ring_mat.name
-                    elif item_data.tag == 'BAMA':
-                        base_material = item_data.get_string()
-                    elif item_data.tag == 'SKMA':
-                        skirt_material = item_data.get_string()
-                    elif item_data.tag == 'HISC':
-                        height_scale = item_data.get_float()
-                    elif item_data.tag == 'ORIN':
-                        orientation = item_data.get_float()
-                    elif item_data.tag == 'SURF':
-                        surface = item_data.get_string()
-                    elif item_data.tag == 'CAVI':
-                        cap_visible = item_data.get_bool()
-                    elif item_data.tag == 'BSVS':
-                        base_visible = item_data.get_bool()
-                        ring_visible = base_visible
-                        skirt_visible = base_visible
-                    elif item_data.tag == 'RIVS':
-                        ring_visible = item_data.get_bool()
-                    elif item_data.tag == 'SKVS':
-                        skirt_visible = item_data.get_bool()
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, BUMPER_TAGS, BUMPER_SKIPPED_TAGS, name=name, x=0.0, y=0.0, radius=45.0, cap_material="", ring_material="", base_material="", skirt_material="", height_scale=90.0, orientation=0.0, surface="",
+                    cap_visible=True, base_visible=True, ring_visible=True, skirt_visible=True)
+                name, x, y, radius, height_scale, orientation, surface = item['name'], item['x'], item['y'], item['radius'], item['height_scale'], item['orientation'], item['surface']
+                cap_material, base_material, skirt_material = item['cap_material'], item['base_material'], item['skirt_material']
+                ring_material = item['ring_material'] or ring_mat.name
+                cap_visible, base_visible, ring_visible, skirt_visible = item['cap_visible'], item['base_visible'], item['ring_visible'], item['skirt_visible']
                 obj = add_core_mesh(created_objects, name, 'Base', "VPX.Core.Bumperbase", STATIC_COL if base_visible else HIDDEN_COL, materials, base_material, "", x, y, 0.0, radius, radius, height_scale, orientation, global_scale)
                 shifted_objects.append((obj, surface))
                 obj = add_core_mesh(created_objects, name, 'Socket', "VPX.Core.Bumpersocket", STATIC_COL if skirt_visible else HIDDEN_COL, materials, skirt_material, "", x, y, 0.0, radius, radius, height_scale, orientation, global_scale)
@@ -843,37 +1219,9 @@ def read_vpx(op, context, filepath):
                 shifted_objects.append((obj, surface))
             
             elif item_type == 6: # Trigger
-                points = []
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'REEN', 'ANSP', 'THOT', 'EBLD')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VCEN':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                    elif item_data.tag == 'SHAP':
-                        shape = item_data.get_u32()
-                    elif item_data.tag == 'RADI':
-                        radius = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'SCAX':
-                        scale_x = item_data.get_float()
-                    elif item_data.tag == 'SCAY':
-                        scale_y = item_data.get_float()
-                    elif item_data.tag == 'WITI':
-                        wire_thickness = item_data.get_float()
-                    elif item_data.tag == 'ROTA':
-                        orientation = item_data.get_float()
-                    elif item_data.tag == 'SURF':
-                        surface = item_data.get_string()
-                    elif item_data.tag == 'VSBL':
-                        visible = item_data.get_bool()
-                    elif item_data.tag == 'DPNT':
-                        points.append(load_point(item_data))
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, TRIGGER_TAGS, TRIGGER_SKIPPED_TAGS, name=name, x=0.0, y=0.0, shape=0, radius=25.0, material="", scale_x=1.0, scale_y=1.0, wire_thickness=0.0, orientation=0.0, surface="", visible=True, points=[])
+                name, x, y, shape, radius, material = item['name'], item['x'], item['y'], item['shape'], item['radius'], item['material']
+                scale_x, scale_y, wire_thickness, orientation, surface, visible = item['scale_x'], item['scale_y'], item['wire_thickness'], item['orientation'], item['surface'], item['visible']
                 scale_z = 1.0
                 if shape == 0:
                     continue
@@ -887,63 +1235,24 @@ def read_vpx(op, context, filepath):
                 shifted_objects.append((obj, surface))
                 if shape == 1 or shape == 3 or shape == 5 or shape == 6 and wire_thickness > 0 and obj.vlmSettings.import_mesh:
                     if obj.type == 'MESH':
-                        bpy.ops.object.select_all(action='DESELECT')
-                        obj.select_set(True)
-                        context.view_layer.objects.active = obj
-                        bpy.ops.object.mode_set(mode='EDIT')
-                        bm = bmesh.from_edit_mesh(obj.data)
-                        for v in bm.verts:
-                            v.co += wire_thickness * v.normal
-                        bmesh.update_edit_mesh(obj.data)
-                        bpy.ops.object.mode_set(mode='OBJECT')
+                        # Inflate the wire along the vertex normals
+                        n_verts = len(obj.data.vertices)
+                        co = np.empty(n_verts * 3, dtype=np.float32)
+                        obj.data.vertices.foreach_get('co', co)
+                        normals = np.empty(n_verts * 3, dtype=np.float32)
+                        obj.data.vertices.foreach_get('normal', normals)
+                        co += wire_thickness * normals
+                        obj.data.vertices.foreach_set('co', co)
+                        obj.data.update()
                     elif obj.type == 'CURVE':
                         pass # FIXME adjust wire thickness
             
             elif item_type == 7: # Light
-                x = y = halo_height = intensity = 0
-                color = color2 = (0,0,0,0)
-                bulb = False
-                image = ''
-                points = []
-                surface = '' # FIXME we should use HGHT if available
-                skipped = ('HGHT', 'STTF', 'SHDW', 'FADE', 'VSBL', 'LOCK', 'LAYR', 'LANR', 'LVIS', 'STAT', 'TMON', 'TMIN', 'SHAP', 'BPAT', 'BINT', 'TRMS', 'BGLS', 'LIDB', 'FASP', 'FASD', 'STBM', 'SHRB', 'BMVA')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VCEN':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                    elif item_data.tag == 'COLR':
-                        color = item_data.get_color()
-                    elif item_data.tag == 'COL2':
-                        color2 = item_data.get_color()
-                    elif item_data.tag == 'BWTH':
-                        intensity = item_data.get_float()
-                    elif item_data.tag == 'SHBM':
-                        show_bulb = item_data.get_bool()
-                    elif item_data.tag == 'BGLS':
-                        is_backglass = item_data.get_bool()
-                    elif item_data.tag == 'IMMO':
-                        is_passthrough = item_data.get_bool()
-                    elif item_data.tag == 'BMSC':
-                        bulb_mesh_radius = item_data.get_float()
-                    elif item_data.tag == 'BULT':
-                        bulb = item_data.get_bool()
-                    elif item_data.tag == 'BHHI':
-                        halo_height = item_data.get_float()
-                    elif item_data.tag == 'RADI':
-                        falloff = item_data.get_float()
-                    elif item_data.tag == 'FAPO':
-                        falloff_power = item_data.get_float()
-                    elif item_data.tag == 'SURF':
-                        surface = item_data.get_string()
-                    elif item_data.tag == 'IMG1':
-                        image = item_data.get_string()
-                    elif item_data.tag == 'DPNT':
-                        points.append(load_point(item_data))
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, LIGHT_TAGS, LIGHT_SKIPPED_TAGS, name=name, x=0, y=0, color=(0,0,0,0), color2=(0,0,0,0), intensity=0, show_bulb=False, is_backglass=False, is_passthrough=False, bulb_mesh_radius=20.0,
+                    bulb=False, halo_height=0, falloff=50.0, falloff_power=2.0, surface='', image='', points=[]) # FIXME surface: we should use HGHT if available
+                name, x, y, halo_height, surface, image, points = item['name'], item['x'], item['y'], item['halo_height'], item['surface'], item['image'], item['points']
+                color, color2, intensity, falloff, falloff_power = item['color'], item['color2'], item['intensity'], item['falloff'], item['falloff_power']
+                bulb, show_bulb, bulb_mesh_radius = item['bulb'], item['show_bulb'], item['bulb_mesh_radius']
 
                 update_mode = get_update(context, name)
                 if update_mode == 0: # No update
@@ -963,7 +1272,7 @@ def read_vpx(op, context, filepath):
                     curve.fill_mode = 'BACK'
                     curve.extrude = max(opt_insert_size + 1, 5) * global_scale
                     curve.transform(mathutils.Matrix.Translation((-x * global_scale, y * global_scale, 0.0)))
-                    curve.materials.append(bpy.data.materials["VPX.Core.Mat.Inserts.Back"])
+                    curve.materials.append(core_materials["VPX.Core.Mat.Inserts.Back"])
                     _, obj = update_object(context, name, 'InsertCup', curve, LIGHTS_COL)
                     obj.vlmSettings.indirect_only = True
                     update_location(obj, x * global_scale, -y * global_scale, halo_height * global_scale - obj.data.extrude)
@@ -992,28 +1301,19 @@ def read_vpx(op, context, filepath):
                     update_location(obj, x * global_scale, -y * global_scale, z * global_scale)
                     created_objects.append(obj.name)
                 else:
-                    obj = bpy.data.objects.new('VPX.Temp', curve)
-                    scene_col.objects.link(obj)
-                    bpy.ops.object.select_all(action='DESELECT')
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    bpy.ops.object.convert(target='MESH')
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    bpy.ops.mesh.select_all(action='SELECT')
-                    bpy.ops.mesh.remove_doubles(threshold = global_scale * 1)
-                    bpy.ops.mesh.dissolve_limited(angle_limit = radians(0.5))
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    bpy.ops.object.shade_flat()
-                    obj = context.view_layer.objects.active
-                    scene_col.objects.unlink(obj)
-                    mesh = obj.data
+                    mesh = curve_to_mesh(context, curve, global_scale * 1, radians(0.5), bm=scratch_bm)
+                    mesh.polygons.foreach_set('use_smooth', [False] * len(mesh.polygons))
                     mesh.use_auto_smooth = True
-                    mesh.normals_split_custom_set([(0,0,1) for i in mesh.loops])
-                    uv_layer = mesh.uv_layers.active.data
-                    for poly in mesh.polygons:
-                        for loop_index in poly.loop_indices:
-                            pt = mesh.vertices[mesh.loops[loop_index].vertex_index]
-                            uv_layer[loop_index].uv = ((pt.co.x - playfield_left) / playfield_width, (playfield_bottom + pt.co.y) / playfield_height)
+                    mesh.normals_split_custom_set([UP_NORMAL] * len(mesh.loops))
+                    loop_vidx = np.empty(len(mesh.loops), dtype=np.int32)
+                    mesh.loops.foreach_get('vertex_index', loop_vidx)
+                    vco = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+                    mesh.vertices.foreach_get('co', vco)
+                    loop_co = vco.reshape(-1, 3)[loop_vidx]
+                    loop_uv = np.empty((len(mesh.loops), 2), dtype=np.float32)
+                    loop_uv[:, 0] = (loop_co[:, 0] - playfield_left) / playfield_width
+                    loop_uv[:, 1] = (playfield_bottom + loop_co[:, 1]) / playfield_height
+                    mesh.uv_layers.active.data.foreach_set('uv', loop_uv.ravel())
                     _, obj = update_object(context, name, '', mesh, LIGHTS_COL)
                     shifted_objects.append((obj, surface))
                     created_objects.append(obj.name)
@@ -1021,7 +1321,13 @@ def read_vpx(op, context, filepath):
                         z = 0.01 * global_scale # Slightly above playfield
                         if bulb:
                             z += halo_height * global_scale
-                        obj.data.transform(mathutils.Matrix.Translation((-x * global_scale, y * global_scale, 0.0)))
+                        co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+                        obj.data.vertices.foreach_get('co', co)
+                        co = co.reshape(-1, 3)
+                        co[:, 0] -= x * global_scale
+                        co[:, 1] += y * global_scale
+                        obj.data.vertices.foreach_set('co', co.ravel())
+                        obj.data.update()
                         obj.location = (x * global_scale, -y * global_scale, z)
                     # Create/Update emitter material
                     mat_name = f"VPX.Emitter.{name}"
@@ -1079,26 +1385,8 @@ def read_vpx(op, context, filepath):
                     shifted_objects.append((obj, surface))
                 
             elif item_type == 8: # Kicker
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'KSCT', 'KHAC', 'KHHI', 'EBLD', 'FATH', 'LEMO')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VCEN':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                    elif item_data.tag == 'RADI':
-                        radius = item_data.get_float()
-                    elif item_data.tag == 'KORI':
-                        orientation = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'TYPE':
-                        type = item_data.get_u32()
-                    elif item_data.tag == 'SURF':
-                        surface = item_data.get_string()
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, KICKER_TAGS, KICKER_SKIPPED_TAGS, name=name, x=0.0, y=0.0, radius=25.0, orientation=0.0, material="", type=0, surface="")
+                name, x, y, radius, orientation, material, type, surface = item['name'], item['x'], item['y'], item['radius'], item['orientation'], item['material'], item['type'], item['surface']
                 if type != 0:
                     z = 0
                     if type == 1 or type == 3:
@@ -1116,33 +1404,9 @@ def read_vpx(op, context, filepath):
                 pass
             
             elif item_type == 10: # Gate
-                type = 1
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'GGFC', 'AFRC', 'GFRC', 'GAMI', 'GAMA', 'ELAS', 'TWWA', 'GCOL', 'REEN')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VCEN':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                    elif item_data.tag == 'GATY':
-                        type = item_data.get_u32()
-                    elif item_data.tag == 'LGTH':
-                        length = item_data.get_float()
-                    elif item_data.tag == 'HGTH':
-                        height = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'ROTA':
-                        orientation = item_data.get_float()
-                    elif item_data.tag == 'SURF':
-                        surface = item_data.get_string()
-                    elif item_data.tag == 'GSUP':
-                        show_bracket = item_data.get_bool()
-                    elif item_data.tag == 'GVSB':
-                        visible = item_data.get_bool()
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, GATE_TAGS, GATE_SKIPPED_TAGS, name=name, x=0.0, y=0.0, type=1, length=100.0, height=50.0, material="", orientation=0.0, surface="", show_bracket=True, visible=True)
+                name, x, y, type, length, height = item['name'], item['x'], item['y'], item['type'], item['length'], item['height']
+                material, orientation, surface, show_bracket, visible = item['material'], item['orientation'], item['surface'], item['show_bracket'], item['visible']
                 meshes = ["", "VPX.Core.Gatewire", "VPX.Core.Gatewirerectangle", "VPX.Core.Gateplate", "VPX.Core.Gatelongplate"]
                 obj = add_core_mesh(created_objects, name, 'Bracket', "VPX.Core.Gatebracket", STATIC_COL if visible and show_bracket else HIDDEN_COL, materials, material, "", x, y, height, length, length, length, orientation, global_scale)
                 shifted_objects.append((obj, surface))
@@ -1150,99 +1414,26 @@ def read_vpx(op, context, filepath):
                 shifted_objects.append((obj, surface))
             
             elif item_type == 11: # Spinner
-                type = 1
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'AFRC', 'SVIS', 'SELA', 'SMIN', 'SMAX', 'AFRC', 'REEN')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VCEN':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                    elif item_data.tag == 'LGTH':
-                        length = item_data.get_float()
-                    elif item_data.tag == 'HIGH':
-                        height = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'IMGF':
-                        image = item_data.get_string()
-                    elif item_data.tag == 'ROTA':
-                        orientation = item_data.get_float()
-                    elif item_data.tag == 'SURF':
-                        surface = item_data.get_string()
-                    elif item_data.tag == 'SSUP':
-                        show_bracket = item_data.get_bool()
-                    elif item_data.tag == 'SVIS':
-                        visible = item_data.get_bool()
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, SPINNER_TAGS, SPINNER_SKIPPED_TAGS, name=name, x=0.0, y=0.0, length=80.0, height=60.0, material="", image="", orientation=0.0, surface="", show_bracket=True, visible=True)
+                name, x, y, length, height = item['name'], item['x'], item['y'], item['length'], item['height']
+                material, image, orientation, surface, show_bracket, visible = item['material'], item['image'], item['orientation'], item['surface'], item['show_bracket'], item['visible']
                 obj = add_core_mesh(created_objects, name, 'Bracket', "VPX.Core.Spinnerbracket", STATIC_COL if visible and show_bracket else HIDDEN_COL, materials, material, "", x, y, height, length, length, length, orientation, global_scale)
                 shifted_objects.append((obj, surface))
                 obj = add_core_mesh(created_objects, name, 'Wire', "VPX.Core.Spinnerplate", MOVABLE_COL if visible else HIDDEN_COL, materials, material, image, x, y, height, length, length, length, orientation, global_scale)
                 shifted_objects.append((obj, surface))
             
             elif item_type == 12: # Ramp
-                material = ""
-                image = ""
-                visible = False
-                height_bottom = 0.0
-                height_top = 0.0
-                width_bottom = 0.0
-                width_top = 0.0
-                wire_diameter = 0.0
-                wire_distance_x = 0.0
-                wire_distance_y = 0.0
-                right_wall_height = 0.0
-                left_wall_height = 0.0
-                image_on_walls = False
-                ramp_type = 0
-                image_alignment = 0
-                points = []
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'OVPH', 'MAPH', 'REEN', 'RADB', 'CLDR', 'RSCT', 'RFCT', 'ELAS', 'THRS', 'HTEV', 'WLHR', 'WLHL', 'TMIN', 'TMON')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'HTBT':
-                        height_bottom = item_data.get_float()
-                    elif item_data.tag == 'HTTP':
-                        height_top = item_data.get_float()
-                    elif item_data.tag == 'WDBT':
-                        width_bottom = item_data.get_float()
-                    elif item_data.tag == 'WDTP':
-                        width_top = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'IMAG':
-                        image = item_data.get_string()
-                    elif item_data.tag == 'IMGW':
-                        image_on_walls = item_data.get_bool()
-                    elif item_data.tag == 'ALGN':
-                        image_alignment = item_data.get_u32()
-                    elif item_data.tag == 'TYPE':
-                        ramp_type = item_data.get_u32()
-                    elif item_data.tag == 'RVIS':
-                        visible = item_data.get_bool()
-                    elif item_data.tag == 'RADI':
-                        wire_diameter = item_data.get_float()
-                    elif item_data.tag == 'RADX':
-                        wire_distance_x = item_data.get_float()
-                    elif item_data.tag == 'RADY':
-                        wire_distance_y = item_data.get_float()
-                    elif item_data.tag == 'WVHR':
-                        right_wall_height = item_data.get_float()
-                    elif item_data.tag == 'WVHL':
-                        left_wall_height = item_data.get_float()
-                    elif item_data.tag == 'DPNT':
-                        points.append(load_point(item_data))
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, RAMP_TAGS, RAMP_SKIPPED_TAGS, name=name, material="", image="", visible=False, height_bottom=0.0, height_top=0.0, width_bottom=0.0, width_top=0.0,
+                    wire_diameter=0.0, wire_distance_x=0.0, wire_distance_y=0.0, right_wall_height=0.0, left_wall_height=0.0, image_on_walls=False, ramp_type=0, image_alignment=0, points=[])
+                name, material, image, visible, points = item['name'], item['material'], item['image'], item['visible'], item['points']
+                height_bottom, height_top, width_bottom, width_top = item['height_bottom'], item['height_top'], item['width_bottom'], item['width_top']
+                wire_diameter, wire_distance_x, wire_distance_y = item['wire_diameter'], item['wire_distance_x'], item['wire_distance_y']
+                right_wall_height, left_wall_height, image_on_walls = item['right_wall_height'], item['left_wall_height'], item['image_on_walls']
+                ramp_type, image_alignment = item['ramp_type'], item['image_alignment']
 
                 update_mode = needs_update(context, name, created_objects, 0, 0, 0)
                 if update_mode < 2: continue
 
-                z_axis = mathutils.Vector((0,0,1))
                 curve_name = f"{name}.Curve"
                 active = is_active(materials, material, image, opaque_images)
                 target_col = (ACTIVE_COL if active else STATIC_COL) if visible else HIDDEN_COL
@@ -1250,101 +1441,67 @@ def read_vpx(op, context, filepath):
                     # Flat ramp, with texture coordinates, RampTypeFlat = 0
                     curve = create_curve(f"VPX.Curve.{name}", points, False, False, global_scale)
                     bzp = curve.splines[0].bezier_points
-                    ratios = []
-                    length = 0
-                    ratios.append(length)
-                    for i in range(len(bzp) - 1):
-                        length += (bzp[i].co-bzp[i+1].co).length
-                        ratios.append(length)
-                    for i, p in enumerate(points):
-                        bzp[i].co.z = (p[2] + height_bottom + (height_top - height_bottom) * ratios[i] / length) * global_scale
-                    obj = bpy.data.objects.new("VPX.Temp", curve)
-                    scene_col.objects.link(obj)
-                    bpy.ops.object.select_all(action='DESELECT')
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    bpy.ops.object.convert(target='MESH')
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    bpy.ops.mesh.select_all(action='SELECT')
-                    bpy.ops.mesh.remove_doubles(threshold = global_scale * 1)
-                    bpy.ops.mesh.dissolve_limited(angle_limit = radians(0.5))
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    scene_col.objects.unlink(obj)
-                    n_verts = len(obj.data.vertices)
-                    normals = []
-                    length = 0
-                    ratios.clear()
-                    ratios.append(length)
-                    for i in range(n_verts):
-                        if i < n_verts - 1:
-                            length += (obj.data.vertices[i].co-obj.data.vertices[i+1].co).length
-                            ratios.append(length)
-                        v = obj.data.vertices[i].co
-                        if i == 0:
-                            n = mathutils.Vector(obj.data.vertices[i + 1].co - v).cross(z_axis)
-                        elif i == n_verts-1:
-                            n = mathutils.Vector(v - obj.data.vertices[i - 1].co).cross(z_axis)
-                        else:
-                            n = (mathutils.Vector(v - obj.data.vertices[i - 1].co) + mathutils.Vector(obj.data.vertices[i + 1].co - v)).cross(z_axis)
-                        n.normalize()
-                        normals.append(n)
-                    verts = []
-                    faces = []
+                    co = np.empty(len(bzp) * 3, dtype=np.float32)
+                    bzp.foreach_get('co', co)
+                    co = co.reshape(-1, 3)
+                    ratios = np.concatenate(((0.0,), np.cumsum(np.linalg.norm(np.diff(co, axis=0), axis=1))))
+                    co[:, 2] = (np.array([p[2] for p in points]) + height_bottom + (height_top - height_bottom) * ratios / ratios[-1]) * global_scale
+                    bzp.foreach_set('co', co.ravel())
+                    bzp[0].co = co[0] # foreach_set does not update the handles, assigning one point does it for the whole spline
+                    curve_mesh = curve_to_mesh(context, curve, global_scale * 1, radians(0.5), bm=scratch_bm)
+                    n_verts = len(curve_mesh.vertices)
+                    co = np.empty(n_verts * 3, dtype=np.float32)
+                    curve_mesh.vertices.foreach_get('co', co)
+                    co = co.reshape(-1, 3)
+                    ratios, nrm = compute_path_normals(co)
+                    length = ratios[-1]
                     # Plastic ramps need to have some thickness for transparent material to render correctly, so we create both sides, slightly separated
-                    for i in range(n_verts):
-                        w = global_scale * (0.5 * (width_bottom + (width_top - width_bottom) * ratios[i] / length) - 0.5)
-                        verts.append((obj.data.vertices[i].co.x-w*normals[i].x, obj.data.vertices[i].co.y-w*normals[i].y, obj.data.vertices[i].co.z-w*normals[i].z))
-                        verts.append((obj.data.vertices[i].co.x+w*normals[i].x, obj.data.vertices[i].co.y+w*normals[i].y, obj.data.vertices[i].co.z+w*normals[i].z))
-                        verts.append((obj.data.vertices[i].co.x-w*normals[i].x, obj.data.vertices[i].co.y-w*normals[i].y, obj.data.vertices[i].co.z-w*normals[i].z + right_wall_height * global_scale))
-                        verts.append((obj.data.vertices[i].co.x+w*normals[i].x, obj.data.vertices[i].co.y+w*normals[i].y, obj.data.vertices[i].co.z+w*normals[i].z + left_wall_height * global_scale))
-                        if i > 0:
-                            faces.append((i*4-4 + 0, i*4-4 + 1, i*4 + 1, i*4 + 0))
-                            if left_wall_height != 0:
-                                faces.append((i*4 + 0, i*4 + 2, i*4-4 + 2, i*4-4 + 0)) # Normal pointing inside
-                                #faces.append((i*4-4 + 0, i*4-4 + 2, i*4 + 2, i*4 + 0)) # Normal pointing outside
-                            if right_wall_height != 0:
-                                faces.append((i*4-4 + 1, i*4-4 + 3, i*4 + 3, i*4 + 1)) # Normal pointing inside
-                                #faces.append((i*4 + 1, i*4 + 3, i*4-4 + 3, i*4-4 + 1)) # Normal pointing outside
+                    # Each side has 4 vertices per curve point: right and left of the floor, then right and left wall top
+                    width = 0.5 * (width_bottom + (width_top - width_bottom) * ratios / length)
+                    side = np.array((-1.0, 1.0, -1.0, 1.0), dtype=np.float32)[:, np.newaxis]
+                    walls = np.zeros((4, 3), dtype=np.float32)
+                    walls[2, 2] = right_wall_height * global_scale
+                    walls[3, 2] = left_wall_height * global_scale
+                    # Top side is 1 unit narrower and bottom side 1 unit wider and lower
+                    w = global_scale * (width + np.array(((-0.5,), (0.5,))))
+                    dz = np.zeros((2, 1, 1, 3), dtype=np.float32)
+                    dz[1, 0, 0, 2] = - global_scale * 1.0
+                    verts = (co[:, np.newaxis] + side * (w[:, :, np.newaxis, np.newaxis] * nrm[:, np.newaxis]) + walls + dz).reshape(-1, 3)
+                    # Faces between each pair of successive curve points, given by offsets from the first vertex of the pair
                     dec = n_verts * 4
-                    dz = - global_scale * 1.0
-                    for i in range(n_verts):
-                        w = global_scale * (0.5 * (width_bottom + (width_top - width_bottom) * ratios[i] / length) + 0.5)
-                        verts.append((obj.data.vertices[i].co.x-w*normals[i].x, obj.data.vertices[i].co.y-w*normals[i].y, obj.data.vertices[i].co.z-w*normals[i].z + dz))
-                        verts.append((obj.data.vertices[i].co.x+w*normals[i].x, obj.data.vertices[i].co.y+w*normals[i].y, obj.data.vertices[i].co.z+w*normals[i].z + dz))
-                        verts.append((obj.data.vertices[i].co.x-w*normals[i].x, obj.data.vertices[i].co.y-w*normals[i].y, obj.data.vertices[i].co.z-w*normals[i].z + dz + right_wall_height * global_scale))
-                        verts.append((obj.data.vertices[i].co.x+w*normals[i].x, obj.data.vertices[i].co.y+w*normals[i].y, obj.data.vertices[i].co.z+w*normals[i].z + dz + left_wall_height * global_scale))
-                        if i > 0:
-                            faces.append((dec+i*4 + 0, dec+i*4 + 1, dec+i*4-4 + 1, dec+i*4-4 + 0)) # back of center part (facing the bottom of the table)
-                            faces.append((i*4-4 + 2, dec + i*4-4 + 2, dec + i*4 + 2, i*4 + 2)) # Top of left wall
-                            faces.append((i*4-4 + 3, dec + i*4-4 + 3, dec + i*4 + 3, i*4 + 3)) # top of right wall
-                            if left_wall_height != 0:
-                                #faces.append((i*4 + 0, i*4 + 2, i*4-4 + 2, i*4-4 + 0)) # Normal pointing inside
-                                faces.append((dec+i*4-4 + 0, dec+i*4-4 + 2, dec+i*4 + 2, dec+i*4 + 0)) # Normal pointing outside
-                            if right_wall_height != 0:
-                                #faces.append((i*4-4 + 1, i*4-4 + 3, i*4 + 3, i*4 + 1)) # Normal pointing inside
-                                faces.append((dec+i*4 + 1, dec+i*4 + 3, dec+i*4-4 + 3, dec+i*4-4 + 1)) # Normal pointing outside
+                    top_faces = [(0, 1, 5, 4)]
+                    bottom_faces = [
+                        (dec+4, dec+5, dec+1, dec+0), # back of center part (facing the bottom of the table)
+                        (2, dec+2, dec+6, 6), # Top of left wall
+                        (3, dec+3, dec+7, 7)] # top of right wall
+                    if left_wall_height != 0:
+                        top_faces.append((4, 6, 2, 0)) # Normal pointing inside
+                        bottom_faces.append((dec+0, dec+2, dec+6, dec+4)) # Normal pointing outside
+                    if right_wall_height != 0:
+                        top_faces.append((1, 3, 7, 5)) # Normal pointing inside
+                        bottom_faces.append((dec+5, dec+7, dec+3, dec+1)) # Normal pointing outside
+                    pair_starts = 4 * np.arange(n_verts - 1, dtype=np.int32)[:, np.newaxis, np.newaxis]
+                    faces = np.concatenate(((pair_starts + np.array(top_faces, dtype=np.int32)).reshape(-1, 4), (pair_starts + np.array(bottom_faces, dtype=np.int32)).reshape(-1, 4)))
                     mesh = bpy.data.meshes.new(f"VPX.RMesh.{name}")
-                    mesh.from_pydata(verts, [], faces)
+                    mesh_from_arrays(mesh, verts, faces)
                     uv_layer = mesh.uv_layers.new().data
-                    for poly in mesh.polygons:
-                        for loop_index in poly.loop_indices:
-                            idx = mesh.loops[loop_index].vertex_index
-                            if idx >= dec:
-                                idx -= dec
-                            if image_alignment == 0:
-                                pt = mesh.vertices[idx]
-                                uv_layer[loop_index].uv = ((pt.co.x - playfield_left) / playfield_width, (playfield_bottom + pt.co.y) / playfield_height)
-                            else:
-                                uv_layer[loop_index].uv = (idx & 1, ratios[idx >> 2] / length)
-                    obj = bpy.data.objects.new('VLM.Tmp', mesh)
-                    scene_col.objects.link(obj)
-                    bpy.ops.object.select_all(action='DESELECT')
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    bpy.ops.object.shade_smooth()
-                    bpy.ops.object.modifier_add(type='EDGE_SPLIT')
-                    bpy.ops.object.modifier_apply(modifier="EdgeSplit")
-                    scene_col.objects.unlink(obj)
+                    loop_vidx = np.empty(len(mesh.loops), dtype=np.int32)
+                    mesh.loops.foreach_get('vertex_index', loop_vidx)
+                    # Both sides share the texture coordinates of the top side
+                    loop_vidx[loop_vidx >= dec] -= dec
+                    loop_uv = np.empty((len(loop_vidx), 2), dtype=np.float32)
+                    if image_alignment == 0:
+                        loop_co = verts[loop_vidx]
+                        loop_uv[:, 0] = (loop_co[:, 0] - playfield_left) / playfield_width
+                        loop_uv[:, 1] = (playfield_bottom + loop_co[:, 1]) / playfield_height
+                    else:
+                        loop_uv[:, 0] = loop_vidx & 1
+                        loop_uv[:, 1] = ratios[loop_vidx >> 2] / length
+                    uv_layer.foreach_set('uv', loop_uv.ravel())
+                    # Smooth shading with sharp edges above 30 degrees (same as the default EdgeSplit modifier), stored as custom split normals
+                    mesh.polygons.foreach_set('use_smooth', [True] * len(mesh.polygons))
+                    mesh.use_auto_smooth = True
+                    mesh.auto_smooth_angle = radians(30)
                     vlm_utils.apply_split_normals(mesh)
                     _, obj = update_object(context, name, '', mesh, target_col)
                 else:
@@ -1358,41 +1515,20 @@ def read_vpx(op, context, filepath):
                     curve.use_fill_caps = True
                     curve.bevel_depth = wire_diameter * 0.5 * global_scale
                     pos = [[(-wire_distance_x/2, 0), (wire_distance_x/2, 0), (-wire_distance_x/2, wire_distance_y), (wire_distance_x/2, wire_distance_y)], [(-wire_distance_x/2, 0), (wire_distance_x/2, 0)], [(-wire_distance_x/2, 0), (wire_distance_x/2, 0), (-wire_distance_x/2, wire_distance_y)], [(-wire_distance_x/2, 0), (wire_distance_x/2, 0), (wire_distance_x/2, wire_distance_y)], [(0, 0)]]
+                    pts = np.array([p[0:3] for p in points], dtype=np.float32)
+                    xy = pts[:, 0:2] * (global_scale, -global_scale)
+                    ratios, nrm = compute_path_normals(xy)
+                    length = ratios[-1]
+                    handle_types = ['AUTO' if p[3] else 'VECTOR' for p in points]
                     for w in pos[ramp_type - 1]:
                         polyline = curve.splines.new('BEZIER')
                         polyline.bezier_points.add(len(points) - 1)
-                        for i, p in enumerate(points):
-                            polyline.bezier_points[i].co = (p[0] * global_scale, -p[1] * global_scale, 0.0)
-                        bzp = polyline.bezier_points
-                        ratios = []
-                        normals = []
-                        length = 0
-                        ratios.clear()
-                        ratios.append(length)
-                        n_verts = len(bzp)
-                        for i in range(n_verts):
-                            if i < n_verts - 1:
-                                length += (bzp[i].co-bzp[i+1].co).length
-                                ratios.append(length)
-                            v = bzp[i].co
-                            if i == 0:
-                                n = mathutils.Vector(bzp[i + 1].co - v).cross(z_axis)
-                            elif i == n_verts-1:
-                                n = mathutils.Vector(v - bzp[i - 1].co).cross(z_axis)
-                            else:
-                                n = (mathutils.Vector(v - bzp[i - 1].co) + mathutils.Vector(bzp[i + 1].co - v)).cross(z_axis)
-                            n.normalize()
-                            normals.append(n)
-                        for i, p in enumerate(points):
-                            dx = w[0] * global_scale * normals[i].x
-                            dy = w[0] * global_scale * normals[i].y
-                            polyline.bezier_points[i].co.x += dx
-                            polyline.bezier_points[i].co.y += dy
-                            polyline.bezier_points[i].co.z = (p[2] + w[1] + height_bottom + (height_top - height_bottom) * ratios[i] / length) * global_scale
-                            if p[3]:
-                                polyline.bezier_points[i].handle_right_type = polyline.bezier_points[i].handle_left_type = 'AUTO'
-                            else:
-                                polyline.bezier_points[i].handle_right_type = polyline.bezier_points[i].handle_left_type = 'VECTOR'
+                        co = np.empty((len(points), 3), dtype=np.float32)
+                        co[:, 0:2] = xy + w[0] * global_scale * nrm
+                        co[:, 2] = (pts[:, 2] + w[1] + height_bottom + (height_top - height_bottom) * ratios / length) * global_scale
+                        polyline.bezier_points.foreach_set('co', co.ravel())
+                        for bp, handle_type in zip(polyline.bezier_points, handle_types):
+                            bp.handle_right_type = bp.handle_left_type = handle_type
                     _, obj = update_object(context, name, '', curve, target_col)
                 update_location(obj, 0, 0, 0)
                 update_material(obj.data, 0, materials, material, image)
@@ -1417,167 +1553,72 @@ def read_vpx(op, context, filepath):
                 pass
             
             elif item_type == 19: # Primitive
-                n_vertices = 0
-                n_indices = 0
-                material = ""
-                image = ""
-                compressed_indices_size = 0
-                compressed_vertices_size = 0
-                vertices = []
-                normals = []
-                faces = []
-                uvs = []
-                visible = True
-                rot_tra = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-                position = (0.0, 0.0, 0.0)
-                size = (1.0, 1.0, 1.0)
-                n_sides = 8
-                skipped = ('BMIN', 'BMAX', 'ZMSK', 'LMAP', 'REFL', 'RSTR', 'REFR', 'RTHI', 'PIID', 'LOCK', 'LAYR', 'LANR', 'LVIS', 'FALP', 'ADDB', 'PIDB', 'M3DN', 'OSNM', 'DIPT', 'OVPH', 'MAPH', 'EBFC', 'NRMA', 'SCOL', 'TVIS', 'DTXI', 'HTEV', 'THRS', 'ELAS', 'ELFO', 'RFCT', 'RSCT', 'EFUI', 'CORF', 'CLDR', 'ISTO', 'STRE', 'DILI', 'DILB', 'REEN', 'COLR')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'IMAG':
-                        image = item_data.get_string()
-                    elif item_data.tag == 'TVIS':
-                        visible = item_data.get_bool()
-                    elif item_data.tag == 'VPOS':
-                        position = (item_data.get_float(), item_data.get_float(), item_data.get_float())
-                        item_data.skip(4)
-                    elif item_data.tag == 'VSIZ':
-                        size = (item_data.get_float(), item_data.get_float(), item_data.get_float())
-                        item_data.skip(4)
-                    elif item_data.tag == 'U3DM':
-                        use_3d_mesh = item_data.get_bool()
-                    elif item_data.tag == 'SIDS':
-                        n_sides = item_data.get_u32()
-                    elif item_data.tag == 'RTV0':
-                        rot_tra[0] = item_data.get_float()
-                    elif item_data.tag == 'RTV1':
-                        rot_tra[1] = item_data.get_float()
-                    elif item_data.tag == 'RTV2':
-                        rot_tra[2] = item_data.get_float()
-                    elif item_data.tag == 'RTV3':
-                        rot_tra[3] = item_data.get_float()
-                    elif item_data.tag == 'RTV4':
-                        rot_tra[4] = item_data.get_float()
-                    elif item_data.tag == 'RTV5':
-                        rot_tra[5] = item_data.get_float()
-                    elif item_data.tag == 'RTV6':
-                        rot_tra[6] = item_data.get_float()
-                    elif item_data.tag == 'RTV7':
-                        rot_tra[7] = item_data.get_float()
-                    elif item_data.tag == 'RTV8':
-                        rot_tra[8] = item_data.get_float()
-                    elif item_data.tag == 'M3VN':
-                        n_vertices = item_data.get_u32()
-                    elif item_data.tag == 'M3CJ':
-                        compressed_indices_size = item_data.get_u32()
-                    elif item_data.tag == 'M3CI':
-                        uncompressed = zlib.decompress(item_data.get(compressed_indices_size))
-                        p = 0
-                        if n_vertices > 65535:
-                            while p < len(uncompressed):
-                                faces.append(struct.unpack("<3I", uncompressed[p:p + 3*4]))
-                                p = p + 3 * 4
-                        else:
-                            while p < len(uncompressed):
-                                faces.append(struct.unpack("<3H", uncompressed[p:p + 3*2]))
-                                p = p + 3 * 2
-                    elif item_data.tag == 'M3DI':
-                        if n_vertices > 65535:
-                            for i in range(int(n_indices / 3)):
-                                faces.append((item_data.get_u32(), item_data.get_u32(), item_data.get_u32()))
-                        else:
-                            for i in range(int(n_indices / 3)):
-                                faces.append((item_data.get_u16(), item_data.get_u16(), item_data.get_u16()))
-                    elif item_data.tag == 'M3FN':
-                        n_indices = item_data.get_u32()
-                    elif item_data.tag == 'M3CY':
-                        compressed_vertices_size = item_data.get_u32()
-                    elif item_data.tag == "M3CX":
-                        uncompressed = zlib.decompress(item_data.get(compressed_vertices_size))
-                        p = 0
-                        while p < len(uncompressed):
-                            vertex = struct.unpack("<3f", uncompressed[p:p + 3*4])
-                            vertex = (-vertex[0], -vertex[1], -vertex[2])
-                            vertices.append(vertex)
-                            p = p + 4 * 3
-                            normal = struct.unpack("<3f", uncompressed[p:p + 3*4])
-                            normal = (-normal[0], -normal[1], -normal[2])
-                            normals.append(normal)
-                            p = p + 4 * 3
-                            uv = struct.unpack("<2f", uncompressed[p:p + 2*4])
-                            uvs.append((uv[0], 1.0 - uv[1]))
-                            p = p + 4 * 2
-                    elif item_data.tag == "M3DX":
-                        d = struct.unpack(f'<{n_vertices * 8}f', item_data.get(n_vertices * 8 * 4))
-                        for i in range(n_vertices):
-                            p = i * 8
-                            vertices.append( (-d[p+0], -d[p+1], -d[p+2]) )
-                            normals.append( (-d[p+3], -d[p+4], -d[p+5]) )
-                            uvs.append( (d[p+6], 1.0 - d[p+7]) )
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, PRIMITIVE_TAGS, PRIMITIVE_SKIPPED_TAGS, name=name, n_vertices=0, n_indices=0, material="", image="", compressed_indices_size=0, compressed_vertices_size=0,
+                    vertices=np.empty((0, 3), dtype=np.float32), normals=np.empty((0, 3), dtype=np.float32), faces=np.empty((0, 3), dtype=np.uint16), uvs=np.empty((0, 2), dtype=np.float32), visible=True, rot_tra=[0.0] * 9, position=(0.0, 0.0, 0.0), size=(1.0, 1.0, 1.0), use_3d_mesh=False, n_sides=8)
+                name, material, image, visible, position, size, rot_tra = item['name'], item['material'], item['image'], item['visible'], item['position'], item['size'], item['rot_tra']
+                use_3d_mesh, n_sides, n_vertices = item['use_3d_mesh'], item['n_sides'], item['n_vertices']
+                vertices, normals, faces, uvs = item['vertices'], item['normals'], item['faces'], item['uvs']
 
+                pos = mathutils.Vector(((position[0] + rot_tra[3])* global_scale, (position[1] + rot_tra[4])* global_scale, (position[2] + rot_tra[5])* global_scale))
+                scale = mathutils.Vector((-size[0] * global_scale, -size[1] * global_scale, -size[2] * global_scale))
+                eul1 = mathutils.Euler((radians(rot_tra[0]), radians(rot_tra[1]), radians(rot_tra[2])), 'ZYX')
+                eul2 = mathutils.Euler((radians(rot_tra[6]), radians(rot_tra[7]), radians(rot_tra[8])), 'ZYX')
+                transform = VPX_AXIS_MATRIX @ mathutils.Matrix.LocRotScale(pos, eul2, None) @ mathutils.Matrix.LocRotScale(None, eul1, scale)
                 update_mode = needs_update(context, name, created_objects, 0, 0, 0)
                 if update_mode == 1:
                     existing = next((o for o in context.scene.objects if name in o.vlmSettings.vpx_object.split(';')), None)
-                    axis_matrix = mathutils.Matrix.Scale(-1, 4, (1,0,0)) @ axis_conversion('-Y', 'Z', 'Y', 'Z').to_4x4()
-                    pos = mathutils.Vector(((position[0] + rot_tra[3])* global_scale, (position[1] + rot_tra[4])* global_scale, (position[2] + rot_tra[5])* global_scale))
-                    scale = mathutils.Vector((-size[0] * global_scale, -size[1] * global_scale, -size[2] * global_scale))
-                    eul1 = mathutils.Euler((radians(rot_tra[0]), radians(rot_tra[1]), radians(rot_tra[2])), 'ZYX')
-                    eul2 = mathutils.Euler((radians(rot_tra[6]), radians(rot_tra[7]), radians(rot_tra[8])), 'ZYX')
-                    existing.matrix_world = axis_matrix @ mathutils.Matrix.LocRotScale(pos, eul2, None) @ mathutils.Matrix.LocRotScale(None, eul1, scale)
+                    existing.matrix_world = transform
                 if update_mode < 2: continue
 
                 mesh_name = f"{name}"
                 mesh = bpy.data.meshes.new(mesh_name)
                 if use_3d_mesh:
-                    mesh.from_pydata(vertices, [], faces)
+                    mesh_from_arrays(mesh, vertices, faces)
                     mesh.flip_normals()
                     mesh.validate()
                     mesh.use_auto_smooth = True
-                    mesh.normals_split_custom_set_from_vertices(normals)
+                    mesh.normals_split_custom_set_from_vertices(normals.tolist())
                     uv_layer = mesh.uv_layers.new()
-                    for i in range(len(mesh.loops)):
-                        uv_layer.data[i].uv = uvs[mesh.loops[i].vertex_index]
-                    bm = bmesh.new()
-                    bm.from_mesh(mesh)
-                    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.01 * global_scale)
-                    bmesh.ops.dissolve_limit(bm, angle_limit=radians(0.1), use_dissolve_boundaries=False, verts=bm.verts, edges=bm.edges, delimit={'NORMAL'})
-                    bm.to_mesh(mesh)
-                    bm.free()
+                    loop_vidx = np.empty(len(mesh.loops), dtype=np.int32)
+                    mesh.loops.foreach_get('vertex_index', loop_vidx)
+                    uv_layer.data.foreach_set('uv', uvs[loop_vidx].ravel())
+                    scratch_bm.from_mesh(mesh)
+                    bmesh.ops.remove_doubles(scratch_bm, verts=scratch_bm.verts, dist=0.01 * global_scale)
+                    bmesh.ops.dissolve_limit(scratch_bm, angle_limit=radians(0.1), use_dissolve_boundaries=False, verts=scratch_bm.verts, edges=scratch_bm.edges, delimit={'NORMAL'})
+                    scratch_bm.to_mesh(mesh)
+                    scratch_bm.clear()
                 else:
-                    bm = bmesh.new()
-                    bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=n_sides, radius1=0.5, radius2=0.5, depth=1, matrix=mathutils.Matrix(), calc_uvs=True)
-                    bm.to_mesh(mesh)
-                    bm.free()
+                    bmesh.ops.create_cone(scratch_bm, cap_ends=True, cap_tris=False, segments=n_sides, radius1=0.5, radius2=0.5, depth=1, matrix=mathutils.Matrix(), calc_uvs=True)
+                    scratch_bm.to_mesh(mesh)
+                    scratch_bm.clear()
                     for p in mesh.polygons:
                         p.use_smooth = True
                     mesh.use_auto_smooth = True
                     #mesh.calc_normals()
                     vlm_utils.apply_split_normals(mesh)
                     uv_layer = mesh.uv_layers.new().data
-                    for poly in mesh.polygons:
-                        for loop_index in poly.loop_indices:
-                            vi = mesh.loops[loop_index].vertex_index
-                            pt = mesh.vertices[vi].co
-                            if poly.normal.z > 0.5: # Top/Bottom sides
-                                uv_layer[loop_index].uv = (0.25 + 0.5 * pt.x, 0.75 + 0.5 * pt.y)
-                            elif poly.normal.z < -0.5: # Top/Bottom sides
-                                uv_layer[loop_index].uv = (0.75 + 0.5 * pt.x, 0.75 + 0.5 * pt.y)
-                            else:
-                                uv_layer[loop_index].uv = ((vi >> 1) / (n_sides - 1), 0.5 * (0.5 - pt.z))
+                    loop_vidx = np.empty(len(mesh.loops), dtype=np.int32)
+                    mesh.loops.foreach_get('vertex_index', loop_vidx)
+                    vco = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+                    mesh.vertices.foreach_get('co', vco)
+                    loop_co = vco.reshape(-1, 3)[loop_vidx]
+                    poly_n = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+                    mesh.polygons.foreach_get('normal', poly_n)
+                    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+                    mesh.polygons.foreach_get('loop_total', loop_total)
+                    loop_nz = np.repeat(poly_n[2::3], loop_total)
+                    top_loops = loop_nz > 0.5
+                    bottom_loops = loop_nz < -0.5
+                    side_loops = ~(top_loops | bottom_loops)
+                    loop_uv = np.empty((len(mesh.loops), 2), dtype=np.float32)
+                    loop_uv[top_loops, 0] = 0.25 + 0.5 * loop_co[top_loops, 0] # Top/Bottom sides
+                    loop_uv[top_loops, 1] = 0.75 + 0.5 * loop_co[top_loops, 1]
+                    loop_uv[bottom_loops, 0] = 0.75 + 0.5 * loop_co[bottom_loops, 0] # Top/Bottom sides
+                    loop_uv[bottom_loops, 1] = 0.75 + 0.5 * loop_co[bottom_loops, 1]
+                    loop_uv[side_loops, 0] = (loop_vidx[side_loops] >> 1) / (n_sides - 1)
+                    loop_uv[side_loops, 1] = 0.5 * (0.5 - loop_co[side_loops, 2])
+                    uv_layer.foreach_set('uv', loop_uv.ravel())
                     
-                axis_matrix = mathutils.Matrix.Scale(-1, 4, (1,0,0)) @ axis_conversion('-Y', 'Z', 'Y', 'Z').to_4x4()
-                pos = mathutils.Vector(((position[0] + rot_tra[3])* global_scale, (position[1] + rot_tra[4])* global_scale, (position[2] + rot_tra[5])* global_scale))
-                scale = mathutils.Vector((-size[0] * global_scale, -size[1] * global_scale, -size[2] * global_scale))
-                eul1 = mathutils.Euler((radians(rot_tra[0]), radians(rot_tra[1]), radians(rot_tra[2])), 'ZYX')
-                eul2 = mathutils.Euler((radians(rot_tra[6]), radians(rot_tra[7]), radians(rot_tra[8])), 'ZYX')
-                transform = axis_matrix @ mathutils.Matrix.LocRotScale(pos, eul2, None) @ mathutils.Matrix.LocRotScale(None, eul1, scale)
                 if name == 'playfield_mesh':
                     mesh.transform(transform)
                     playfield_mesh = mesh.name
@@ -1591,73 +1632,28 @@ def read_vpx(op, context, filepath):
                 created_objects.append(obj.name)
                     
             elif item_type == 20: # Flasher
-                height = 0
-                x = 0
-                y = 0
-                material = ""
-                image = ""
-                visible = True
-                points = []
-                skipped = ('PIID', 'LOCK', 'LAYR', 'LANR', 'LVIS', 'TMON', 'TMIN', 'IDMD', 'DSPT', 'FLDB', 'FILT', 'FIAM')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'FHEI':
-                        height = item_data.get_float()
-                    elif item_data.tag == 'FLAX':
-                        x = item_data.get_float()
-                    elif item_data.tag == 'FLAY':
-                        y = item_data.get_float()
-                    elif item_data.tag == 'FROX':
-                        rot_x = item_data.get_float()
-                    elif item_data.tag == 'FROY':
-                        rot_y = item_data.get_float()
-                    elif item_data.tag == 'FROZ':
-                        rot_z = item_data.get_float()
-                    elif item_data.tag == 'COLR':
-                        color = item_data.get_color()
-                    elif item_data.tag == 'IMAG':
-                        image_a = item_data.get_string()
-                    elif item_data.tag == 'IMAB':
-                        image_b = item_data.get_string()
-                    elif item_data.tag == 'FALP':
-                        alpha = item_data.get_32()
-                    elif item_data.tag == 'MOVA':
-                        modulate_vs_add = item_data.get_float()
-                    elif item_data.tag == 'FVIS':
-                        visible = item_data.get_bool()
-                    elif item_data.tag == 'ADDB':
-                        additive_blend = item_data.get_bool()
-                    elif item_data.tag == 'ALGN':
-                        image_alignment = item_data.get_u32()
-                    elif item_data.tag == 'DPNT':
-                        points.append(load_point(item_data))
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, FLASHER_TAGS, FLASHER_SKIPPED_TAGS, name=name, height=0, x=0, y=0, rot_x=0.0, rot_y=0.0, rot_z=0.0, color=(1.0, 1.0, 1.0, 1), image_a="", image_b="",
+                    alpha=100, modulate_vs_add=0.9, visible=True, additive_blend=False, image_alignment=1, points=[])
+                name, height, x, y, rot_x, rot_y, rot_z = item['name'], item['height'], item['x'], item['y'], item['rot_x'], item['rot_y'], item['rot_z']
+                color, image_a, image_b, alpha, modulate_vs_add = item['color'], item['image_a'], item['image_b'], item['alpha'], item['modulate_vs_add']
+                visible, additive_blend, image_alignment, points = item['visible'], item['additive_blend'], item['image_alignment'], item['points']
                 mesh = bpy.data.meshes.new(f'{name}.Quad')
-                minx = miny = 100000000
-                maxx = maxy = -100000000
-                for pt in points:
-                    minx = min( pt[0] * global_scale, minx)
-                    miny = min(-pt[1] * global_scale, miny)
-                    maxx = max( pt[0] * global_scale, maxx)
-                    maxy = max(-pt[1] * global_scale, maxy)
-                half_x = 0.5 * (maxx + minx)
-                half_y = 0.5 * (maxy + miny)
-                verts = [(pt[0] * global_scale - half_x, -pt[1] * global_scale - half_y, 0.0) for pt in points]
-                faces = [tuple([idx for idx in range(len(points))])]
-                mesh.from_pydata(verts, [], faces)
+                pts = np.array([p[0:2] for p in points], dtype=np.float32) * (global_scale, -global_scale)
+                pts_min, pts_max = pts.min(axis=0), pts.max(axis=0)
+                half_x, half_y = (0.5 * (pts_min + pts_max)).tolist()
+                verts = np.zeros((len(points), 3), dtype=np.float32)
+                verts[:, 0:2] = pts - (half_x, half_y)
+                mesh_from_arrays(mesh, verts, np.arange(len(points)).reshape(1, -1))
                 mesh.use_auto_smooth = True
-                mesh.normals_split_custom_set([(0,0,1) for i in mesh.loops])
+                mesh.normals_split_custom_set([UP_NORMAL] * len(mesh.loops))
                 uv_layer = mesh.uv_layers.new().data
-                for poly in mesh.polygons:
-                    for loop_index in poly.loop_indices:
-                        pt = mesh.vertices[mesh.loops[loop_index].vertex_index]
-                        if image_alignment == 0: # World
-                            uv_layer[loop_index].uv = ((pt.co.x + half_x - playfield_left) / playfield_width, (playfield_bottom + pt.co.y + half_y) / playfield_height)
-                        else: # Wrap
-                            uv_layer[loop_index].uv = (0.5 + pt.co.x / (maxx - minx), 0.5 + pt.co.y / (maxy - miny))
+                if image_alignment == 0: # World
+                    uv_scale = (1.0 / playfield_width, 1.0 / playfield_height)
+                    uv_offset = (-playfield_left / playfield_width, playfield_bottom / playfield_height)
+                else: # Wrap
+                    uv_scale = 1.0 / (pts_max - pts_min)
+                    uv_offset = 0.5 - np.array((half_x, half_y)) * uv_scale
+                uv_layer.foreach_set('uv', (pts * uv_scale + uv_offset).astype(np.float32).ravel()) # Loops are in point order
                             
                 if additive_blend:
                     light = bpy.data.lights.new(name=f'{name}.Light', type='POINT')
@@ -1668,40 +1664,41 @@ def read_vpx(op, context, filepath):
                     update_location(obj, half_x, half_y, global_scale * height)
                     created_objects.append(obj.name)
 
-                is_insert_overlay = opt_detect_insert_overlay and 'insert' in name.casefold()
+                name_cf = name.casefold()
+                is_insert_overlay = opt_detect_insert_overlay and 'insert' in name_cf
                 existing, obj = update_object(context, name, 'Flasher', mesh, STATIC_COL if is_insert_overlay else HIDDEN_COL)
                 if ';' not in obj.vlmSettings.vpx_object and obj.vlmSettings.import_transform:
-                    obj.rotation_euler = mathutils.Euler((-radians(rot_x), -radians(rot_y), -radians(rot_z)), 'ZYX')
+                    obj.rotation_euler = (-radians(rot_x), -radians(rot_y), -radians(rot_z))
                     #obj.location = (global_scale * x, -global_scale * y, global_scale * height)
                     obj.location = (half_x, half_y, global_scale * height)
                 created_objects.append(obj.name)
-                mat_name = f"VPX.Flasher.{name.casefold()}"
+                mat_name = f"VPX.Flasher.{name_cf}"
+                group_name, tex_a_name, tex_b_name = f"{mat_name}.Mat", f"{mat_name}.TexA", f"{mat_name}.TexB"
                 image_a = f"VPX.Tex.{image_a.casefold()}"
                 image_b = f"VPX.Tex.{image_b.casefold()}"
                 # Create material if needed
-                if mat_name in bpy.data.materials:
-                    mat = bpy.data.materials[mat_name]
-                else:
+                mat = bpy.data.materials.get(mat_name)
+                if mat is None:
                     mat = bpy.data.materials.new(mat_name)
                     mat.use_nodes = True
                     nodes = mat.node_tree.nodes
                     nodes.clear()
                     links = mat.node_tree.links
                     group = nodes.new("ShaderNodeGroup")
-                    group.name = f"{mat_name}.Mat"
+                    group.name = group_name
                     group.width = 300
                     group.node_tree = bpy.data.node_groups['VPX.Flasher']
                     node_output = nodes.new(type='ShaderNodeOutputMaterial')   
                     node_output.location.x = 400
                     links.new(group.outputs[0], node_output.inputs[0])
                     node_texA = nodes.new(type='ShaderNodeTexImage')
-                    node_texA.name = f"{mat_name}.TexA"
+                    node_texA.name = tex_a_name
                     node_texA.extension = 'CLIP'
                     node_texA.location.x = -400
                     links.new(node_texA.outputs[0], group.inputs[0])
                     links.new(node_texA.outputs[1], group.inputs[1])
                     node_texB = nodes.new(type='ShaderNodeTexImage')
-                    node_texB.name = f"{mat_name}.TexB"
+                    node_texB.name = tex_b_name
                     node_texB.extension = 'CLIP'
                     node_texB.location.x = -400
                     node_texB.location.y = -300
@@ -1714,28 +1711,26 @@ def read_vpx(op, context, filepath):
                     mesh.materials[0] = mat
                 # update VPX material
                 mat = mesh.materials[0]
+                nodes = mat.node_tree.nodes
+                images = bpy.data.images
                 use_imageA = 0
-                if f"{mat_name}.TexA" in mat.node_tree.nodes:
-                    node_texA = mat.node_tree.nodes[f"{mat_name}.TexA"]
-                    if image_a in bpy.data.images:
-                        node_texA.image = bpy.data.images[image_a]
+                node_texA = nodes.get(tex_a_name)
+                if node_texA is not None:
+                    node_texA.image = images.get(image_a)
+                    if node_texA.image is not None:
                         use_imageA = 1
-                    else:
-                        if image_a != "VPX.Tex.":
-                            logger.info(f"Missing texture {image_a}")
-                        node_texA.image = None
+                    elif image_a != "VPX.Tex.":
+                        logger.info(f"Missing texture {image_a}")
                 use_imageB = 0
-                if f"{mat_name}.TexB" in mat.node_tree.nodes:
-                    node_texB = mat.node_tree.nodes[f"{mat_name}.TexB"]
-                    if image_b in bpy.data.images:
-                        node_texB.image = bpy.data.images[image_b]
+                node_texB = nodes.get(tex_b_name)
+                if node_texB is not None:
+                    node_texB.image = images.get(image_b)
+                    if node_texB.image is not None:
                         use_imageB = 1
-                    else:
-                        if image_b != "VPX.Tex.":
-                            logger.info(f"Missing texture {image_b}")
-                        node_texB.image = None
-                if f"{mat_name}.Mat" in mat.node_tree.nodes:
-                    group = mat.node_tree.nodes[f"{mat_name}.Mat"]
+                    elif image_b != "VPX.Tex.":
+                        logger.info(f"Missing texture {image_b}")
+                group = nodes.get(group_name)
+                if group is not None:
                     group.inputs[2].default_value = use_imageA
                     group.inputs[5].default_value = use_imageB
                     group.inputs[6].default_value = 0 # filter type
@@ -1748,40 +1743,9 @@ def read_vpx(op, context, filepath):
                         group.inputs[12].default_value = 1.0 # Insert overlays are diffuse shaded (not emissive)
 
             elif item_type == 21: # Rubber
-                material = ""
-                image = ""
-                visible = False
-                height = 0.0
-                thickness = 0.0
-                rotate_x = 0.0
-                rotate_y = 0.0
-                rotate_z = 0.0
-                points = []
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'OVPH', 'MAPH', 'REEN', 'ESIE', 'ESTR', 'CLDR', 'RSCT', 'RFCT', 'ELAS', 'ELFO', 'TMIN', 'TMON', 'HTHI', 'HTEV')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'HTTP':
-                        height = item_data.get_float()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'IMAG':
-                        image = item_data.get_string()
-                    elif item_data.tag == 'RVIS':
-                        visible = item_data.get_bool()
-                    elif item_data.tag == 'WDTP':
-                        thickness = item_data.get_u32()
-                    elif item_data.tag == 'ROTX':
-                        rotate_x = item_data.get_float()
-                    elif item_data.tag == 'ROTY':
-                        rotate_y = item_data.get_float()
-                    elif item_data.tag == 'ROTZ':
-                        rotate_z = item_data.get_float()
-                    elif item_data.tag == 'DPNT':
-                        points.append(load_point(item_data))
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
+                item = read_item(item_data, RUBBER_TAGS, RUBBER_SKIPPED_TAGS, name=name, material="", image="", visible=False, height=0.0, thickness=0.0, rotate_x=0.0, rotate_y=0.0, rotate_z=0.0, points=[])
+                name, material, image, visible, height, thickness, points = item['name'], item['material'], item['image'], item['visible'], item['height'], item['thickness'], item['points']
+                rotate_x, rotate_y, rotate_z = item['rotate_x'], item['rotate_y'], item['rotate_z']
 
                 update_mode = needs_update(context, name, created_objects, 0, 0, global_scale * height)
                 if update_mode < 2: continue
@@ -1796,20 +1760,10 @@ def read_vpx(op, context, filepath):
                 polyline = curve.splines.new('BEZIER')
                 polyline.bezier_points.add(len(points) - 1)
                 polyline.use_cyclic_u = True
-                for i, p in enumerate(points):
-                    polyline.bezier_points[i].co = (p[0] * global_scale, -p[1] * global_scale, p[2] * global_scale)
-                bzp = polyline.bezier_points
-                ratios = []
-                length = 0
-                ratios.append(length)
-                for i in range(len(bzp) - 1):
-                    length += (bzp[i].co-bzp[i+1].co).length
-                    ratios.append(length)
-                for i, p in enumerate(points):
-                    if p[3]:
-                        polyline.bezier_points[i].handle_right_type = polyline.bezier_points[i].handle_left_type = 'AUTO'
-                    else:
-                        polyline.bezier_points[i].handle_right_type = polyline.bezier_points[i].handle_left_type = 'VECTOR'
+                co = np.array([p[0:3] for p in points], dtype=np.float32) * (global_scale, -global_scale, global_scale)
+                polyline.bezier_points.foreach_set('co', co.ravel())
+                for bp, p in zip(polyline.bezier_points, points):
+                    bp.handle_right_type = bp.handle_left_type = 'AUTO' if p[3] else 'VECTOR'
                 active = is_active(materials, material, image, opaque_images)
                 target_col = (ACTIVE_COL if active else STATIC_COL) if visible else HIDDEN_COL
                 _, obj = update_object(context, name, '', curve, target_col)
@@ -1819,44 +1773,17 @@ def read_vpx(op, context, filepath):
                 created_objects.append(obj.name)
         
             elif item_type == 22: # Hit Target
-                skipped = ('LOCK', 'LAYR', 'LANR', 'LVIS', 'SLNG', 'OVPH', 'MAPH', 'RADE', 'TMIN', 'TMON', 'DRSP', 'ISDR', 'PIDB', 'REEN', 'DILI', 'DILB', 'CLDR', 'ELAS', 'ELFO', 'RSCT', 'RFCT', 'THRS', 'LEMO', 'HTEV')
-                while not item_data.is_eof():
-                    item_data.next()
-                    if item_data.tag == 'NAME':
-                        name = item_data.get_wide_string()
-                    elif item_data.tag == 'VPOS':
-                        x = item_data.get_float()
-                        y = item_data.get_float()
-                        z = item_data.get_float()
-                        item_data.skip(4)
-                    elif item_data.tag == 'VSIZ':
-                        x_size = item_data.get_float()
-                        y_size = item_data.get_float()
-                        z_size = item_data.get_float()
-                        item_data.skip(4)
-                    elif item_data.tag == 'ROTZ':
-                        rot_z = item_data.get_float()
-                    elif item_data.tag == 'IMAG':
-                        image = item_data.get_string()
-                    elif item_data.tag == 'MATR':
-                        material = item_data.get_string()
-                    elif item_data.tag == 'TRTY':
-                        type = item_data.get_u32()
-                    elif item_data.tag == 'TVIS':
-                        visible = item_data.get_bool()
-                    elif item_data.tag in skipped:
-                        item_data.skip_tag()
-
-                #DropTargetBeveled, DropTargetSimple, HitTargetRound, HitTargetRectangle, HitFatTargetRectangle, HitFatTargetSquare, DropTargetFlatSimple, HitFatTargetSlim, HitTargetSlim
-                meshes = ["", "VPX.Core.Droptargett2", "VPX.Core.Droptargett3", 
-                    "VPX.Core.Hittargetround", "VPX.Core.Hittargetrectangle", "VPX.Core.Hittargetfatrectangle",
-                    "VPX.Core.Hittargetfatsquare", "VPX.Core.Droptargett4", "VPX.Core.Hittargett2slim", "VPX.Core.Hittargett1slim"]
+                item = read_item(item_data, HIT_TARGET_TAGS, HIT_TARGET_SKIPPED_TAGS, name=name, position=(0.0, 0.0, 0.0), size=(32.0, 32.0, 32.0), rot_z=0.0, image="", material="", target_type=2, visible=True)
+                name, (x, y, z), (x_size, y_size, z_size), rot_z = item['name'], item['position'], item['size'], item['rot_z']
+                image, material, target_type, visible = item['image'], item['material'], item['target_type'], item['visible']
+
                 active = is_active(materials, material, image, opaque_images)
-                target_col = MOVABLE_COL if type in [1, 2, 7] else (ACTIVE_COL if active else STATIC_COL)
-                obj = add_core_mesh(created_objects, name, '', meshes[type], target_col if visible else HIDDEN_COL, materials, material, image, x, y, z, x_size, y_size, z_size, rot_z, global_scale)
+                target_col = MOVABLE_COL if target_type in MOVABLE_HIT_TARGET_TYPES else (ACTIVE_COL if active else STATIC_COL)
+                obj = add_core_mesh(created_objects, name, '', HIT_TARGET_MESHES[target_type], target_col if visible else HIDDEN_COL, materials, material, image, x, y, z, x_size, y_size, z_size, rot_z, global_scale)
 
             else:
                 logger.info(f"GameStg/GameItem{index}: unsupported type #{item_type}")
+        scratch_bm.free()
     
     # Shift object that are positionned on a surface
     for obj, surface in shifted_objects:
@@ -1867,11 +1794,11 @@ def read_vpx(op, context, filepath):
     if playfield_mesh != "":
         pfmesh = bpy.data.meshes[playfield_mesh]
     else:
-        vert = [(playfield_left, -playfield_bottom, 0.0), (playfield_right, -playfield_bottom, 0.0), (playfield_left, -playfield_top, 0.0), (playfield_right, -playfield_top, 0.0)]
+        vert = np.array([(playfield_left, -playfield_bottom, 0.0), (playfield_right, -playfield_bottom, 0.0), (playfield_left, -playfield_top, 0.0), (playfield_right, -playfield_top, 0.0)])
         pfmesh = bpy.data.meshes.new("VPX.Mesh.Playfield")
-        pfmesh.from_pydata(vert, [], [(0, 1, 3, 2)])
+        mesh_from_arrays(pfmesh, vert, np.array([(0, 1, 3, 2)]))
         pfmesh.use_auto_smooth = True
-        pfmesh.normals_split_custom_set([(0,0,1) for i in pfmesh.loops])
+        pfmesh.normals_split_custom_set([UP_NORMAL] * len(pfmesh.loops))
         uv_layer = pfmesh.uv_layers.new()
     _, playfield_obj = update_object(context, 'Playfield', '', pfmesh, STATIC_COL)
     playfield_obj.location = (0, 0, -0.01 * global_scale) # Move very slightly back to avoid exact matching with bottom of wall that would led to a 'hold out' shading
@@ -1981,9 +1908,11 @@ def read_vpx(op, context, filepath):
             movables.name = "Movables"
         
     # Move to hidden all imported objects that were not reimported
-    for obj in [obj for obj in scene_col.all_objects if obj.vlmSettings.vpx_object != '' and obj.name not in created_objects]:
+    created_names = set(created_objects)
+    hidden_col = vlm_collections.get_collection(context.scene.collection, HIDDEN_COL)
+    for obj in [obj for obj in scene_col.all_objects if obj.vlmSettings.vpx_object != '' and obj.name not in created_names]:
         vlm_collections.unlink(obj)
-        vlm_collections.get_collection(context.scene.collection, HIDDEN_COL).objects.link(obj)
+        hidden_col.objects.link(obj)
         logger.info(f". Hiding '{obj.name}' since it was not found in the VPX table file (source VPX object '{obj.vlmSettings.vpx_object}', subpart '{obj.vlmSettings.vpx_subpart}')")
         
     # Output warnings for split normals